@@ -12,6 +12,7 @@ import logging
 import os
 import subprocess
 import time
+from collections import Counter
 from datetime import datetime, timedelta
 
 import yaml
@@ -40,15 +41,18 @@ class AnalyticsCollector:
     def collect_git_metrics(self):
         """Collect Git repository metrics"""
         try:
+            # One git log call covers every 30-day metric below
+            history = self._get_recent_git_history(30)
+
             # Get commit history metrics
-            commits_last_30_days = self._get_git_commits_count(30)
-            commits_last_7_days = self._get_git_commits_count(7)
+            commits_last_30_days = len(history)
+            commits_last_7_days = self._get_git_commits_count(history, 7)
 
             # Get file change frequency
-            file_changes = self._get_file_change_frequency()
+            file_changes = self._get_file_change_frequency(history)
 
             # Get contributor metrics
-            contributors = self._get_contributor_metrics()
+            contributors = self._get_contributor_metrics(history)
 
             # Get branch metrics
             branch_info = self._get_branch_metrics()
@@ -58,7 +62,7 @@ class AnalyticsCollector:
                 "commits": {
                     "last_30_days": commits_last_30_days,
                     "last_7_days": commits_last_7_days,
-                    "today": self._get_git_commits_count(1),
+                    "today": self._get_git_commits_count(history, 1),
                 },
                 "file_changes": file_changes,
                 "contributors": contributors,
@@ -137,45 +141,40 @@ class AnalyticsCollector:
             self.logger.error(f"Error collecting performance metrics: {e}")
             return {}
 
-    def _get_git_commits_count(self, days):
+    def _get_recent_git_history(self, days):
+        """Get (timestamp, author, files) for each commit in the last N days"""
+        since_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+        result = subprocess.run(
+            ["git", "log", f"--since={since_date}", "--name-only", "--pretty=format:%x1e%ct%x09%an"],
+            check=False,
+            capture_output=True,
+            text=True,
+            cwd=self.repo_path,
+        )
+
+        history = []
+        # Each commit record starts with a record separator, then "timestamp<TAB>author"
+        for record in result.stdout.split("\x1e")[1:]:
+            header, _, names = record.partition("\n")
+            timestamp, _, author = header.partition("\t")
+            files = [name for name in names.split("\n") if name]
+            history.append((int(timestamp), author, files))
+
+        return history
+
+    def _get_git_commits_count(self, history, days):
         """Get number of commits in the last N days"""
-        since_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-        cmd = f"git log --since='{since_date}' --oneline | wc -l"
-        result = subprocess.run(cmd, check=False, shell=True, capture_output=True, text=True, cwd=self.repo_path)
-        return int(result.stdout.strip()) if result.stdout.strip() else 0
-
-    def _get_file_change_frequency(self):
-        """Get file change frequency over last 30 days"""
-        cmd = "git log --since='30 days ago' --name-only --pretty=format: | sort | uniq -c | sort -nr"
-        result = subprocess.run(cmd, check=False, shell=True, capture_output=True, text=True, cwd=self.repo_path)
-
-        file_changes = {}
-        for line in result.stdout.strip().split("\n"):
-            if line.strip():
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    count = int(parts[0])
-                    filename = " ".join(parts[1:])
-                    if filename.endswith(".md"):
-                        file_changes[filename] = count
-
-        return dict(list(file_changes.items())[:20])  # Top 20 most changed files
-
-    def _get_contributor_metrics(self):
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+        return sum(1 for timestamp, _, _ in history if timestamp >= cutoff)
+
+    def _get_file_change_frequency(self, history):
+        """Get file change frequency over the given history"""
+        counts = Counter(name for _, _, files in history for name in files if name.endswith(".md"))
+        return dict(counts.most_common(20))  # Top 20 most changed files
+
+    def _get_contributor_metrics(self, history):
         """Get contributor metrics"""
-        cmd = "git log --since='30 days ago' --pretty=format:'%an' | sort | uniq -c | sort -nr"
-        result = subprocess.run(cmd, check=False, shell=True, capture_output=True, text=True, cwd=self.repo_path)
-
-        contributors = {}
-        for line in result.stdout.strip().split("\n"):
-            if line.strip():
-                parts = line.strip().split(None, 1)
-                if len(parts) >= 2:
-                    count = int(parts[0])
-                    name = parts[1]
-                    contributors[name] = count
-
-        return contributors
+        return dict(Counter(author for _, author, _ in history).most_common())
 
     def _get_branch_metrics(self):
         """Get branch information"""
@@ -36,6 +36,14 @@ except ImportError:
     PerformanceMonitor = None
 
 
+# Default alert thresholds; health_score and error_rate are percentages
+_DEFAULT_ALERT_THRESHOLDS = {
+    "health_score": 80,
+    "performance_degradation": 20,
+    "error_rate": 5,
+}
+
+
 class AutomatedReporter:
     """Generates and sends automated reports"""
 
@@ -43,17 +51,24 @@ class AutomatedReporter:
         self.repo_path = repo_path or os.getcwd()
         self.config = self._load_config(config_file)
 
+        # Alert thresholds are fixed for the reporter's lifetime; _load_config only
+        # merges top-level sections, so missing keys fall back to the defaults
+        thresholds = {**_DEFAULT_ALERT_THRESHOLDS, **self.config.get("reports", {}).get("alert_threshold", {})}
+        self._thresh_health = thresholds["health_score"]
+        self._thresh_error_rate = thresholds["error_rate"]
+
         # Setup directories
-        self.reports_dir = os.path.join(self.repo_path, "monitoring", "reports")
-        self.metrics_dir = os.path.join(self.repo_path, "monitoring", "metrics")
-        self.logs_dir = os.path.join(self.repo_path, "monitoring", "logs")
+        monitoring_dir = Path(self.repo_path) / "monitoring"
+        self.reports_dir = monitoring_dir / "reports"
+        self.metrics_dir = monitoring_dir / "metrics"
+        self.logs_dir = monitoring_dir / "logs"
 
         for dir_path in [self.reports_dir, self.metrics_dir, self.logs_dir]:
-            os.makedirs(dir_path, exist_ok=True)
+            dir_path.mkdir(parents=True, exist_ok=True)
 
         # Setup logging
         logging.basicConfig(
-            filename=os.path.join(self.logs_dir, "automated_reports.log"),
+            filename=self.logs_dir / "automated_reports.log",
             level=logging.INFO,
             format="%(asctime)s - %(levelname)s - %(message)s",
         )
@@ -78,11 +93,7 @@ class AutomatedReporter:
                 "daily_summary": True,
                 "weekly_analysis": True,
                 "monthly_comprehensive": True,
-                "alert_threshold": {
-                    "health_score": 80,
-                    "performance_degradation": 20,
-                    "error_rate": 5,
-                },
+                "alert_threshold": dict(_DEFAULT_ALERT_THRESHOLDS),
             },
             "notifications": {
                 "slack_webhook": "",
@@ -128,14 +139,14 @@ class AutomatedReporter:
 
             # Save report
             report_filename = f"daily_summary_{today.strftime('%Y%m%d')}.json"
-            report_path = os.path.join(self.reports_dir, report_filename)
+            report_path = self.reports_dir / report_filename
 
             with open(report_path, "w") as f:
                 json.dump(report_data, f, indent=2, default=str)
 
             # Save text version
             text_filename = f"daily_summary_{today.strftime('%Y%m%d')}.txt"
-            text_path = os.path.join(self.reports_dir, text_filename)
+            text_path = self.reports_dir / text_filename
 
             with open(text_path, "w") as f:
                 f.write(summary_text)
@@ -175,14 +186,14 @@ class AutomatedReporter:
 
             # Save report
             report_filename = f"weekly_analysis_{today.strftime('%Y%m%d')}.json"
-            report_path = os.path.join(self.reports_dir, report_filename)
+            report_path = self.reports_dir / report_filename
 
             with open(report_path, "w") as f:
                 json.dump(report_data, f, indent=2, default=str)
 
             # Save text version
             text_filename = f"weekly_analysis_{today.strftime('%Y%m%d')}.txt"
-            text_path = os.path.join(self.reports_dir, text_filename)
+            text_path = self.reports_dir / text_filename
 
             with open(text_path, "w") as f:
                 f.write(analysis_text)
@@ -225,14 +236,14 @@ class AutomatedReporter:
 
             # Save report
             report_filename = f"monthly_comprehensive_{today.strftime('%Y%m')}.json"
-            report_path = os.path.join(self.reports_dir, report_filename)
+            report_path = self.reports_dir / report_filename
 
             with open(report_path, "w") as f:
                 json.dump(report_data, f, indent=2, default=str)
 
             # Save text version
             text_filename = f"monthly_comprehensive_{today.strftime('%Y%m')}.txt"
-            text_path = os.path.join(self.reports_dir, text_filename)
+            text_path = self.reports_dir / text_filename
 
             with open(text_path, "w") as f:
                 f.write(comprehensive_text)
@@ -262,14 +273,18 @@ class AutomatedReporter:
             "totals": {},
         }
 
-        # Try to collect daily reports from the week
+        # Try to collect daily reports from the week; list the directory once
+        # instead of probing each expected filename individually
+        with os.scandir(self.reports_dir) as entries:
+            available = {entry.name for entry in entries}
+
         daily_reports = []
         for i in range(7):
             date = start_date + timedelta(days=i)
-            daily_file = os.path.join(self.reports_dir, f"daily_summary_{date.strftime('%Y%m%d')}.json")
-            if os.path.exists(daily_file):
+            daily_name = f"daily_summary_{date.strftime('%Y%m%d')}.json"
+            if daily_name in available:
                 try:
-                    with open(daily_file) as f:
+                    with open(self.reports_dir / daily_name) as f:
                         daily_data = json.load(f)
                         daily_reports.append(daily_data)
                 except:
@@ -311,9 +326,8 @@ class AutomatedReporter:
 
         # Collect all available daily and weekly reports
         all_reports = []
-        reports_dir = Path(self.reports_dir)
 
-        for report_file in reports_dir.glob("daily_summary_*.json"):
+        for report_file in self.reports_dir.glob("daily_summary_*.json"):
             try:
                 with open(report_file) as f:
                     data = json.load(f)
@@ -484,40 +498,49 @@ EXECUTIVE SUMMARY
     def _check_daily_alerts(self, data):
         """Check for conditions that require alerts"""
         alerts = []
-        thresholds = self.config["reports"]["alert_threshold"]
+        performance = data.get("performance")
+        if not performance:
+            return alerts
 
         # Check health score
-        if "performance" in data:
-            health = data["performance"].get("health_score", {}).get("overall", 100)
-            if health < thresholds["health_score"]:
+        health = performance.get("health_score", {}).get("overall", 100)
+        if health < self._thresh_health:
+            alerts.append(
+                {
+                    "level": "warning",
+                    "message": f"Health score dropped to {health:.1f}% (threshold: {self._thresh_health}%)",
+                    "metric": "health_score",
+                    "value": health,
+                }
+            )
+
+        # Check for performance issues
+        git_ops = performance.get("git_operations", {})
+        total_ops = len(git_ops)
+        if total_ops > 0:
+            # Stop counting once even all remaining operations failing could not
+            # push the rate over the threshold; no alert is raised in that case
+            failed_ops = 0
+            remaining = total_ops
+            for op in git_ops.values():
+                if (failed_ops + remaining) / total_ops * 100 <= self._thresh_error_rate:
+                    break
+                remaining -= 1
+                if not op.get("success", True):
+                    failed_ops += 1
+            error_rate = (failed_ops / total_ops) * 100
+            if error_rate > self._thresh_error_rate:
                 alerts.append(
                     {
-                        "level": "warning",
-                        "message": f"Health score dropped to {health:.1f}% (threshold: {thresholds['health_score']}%)",
-                        "metric": "health_score",
-                        "value": health,
+                        "level": "critical",
+                        "message": (
+                            f"High error rate detected: {error_rate:.1f}% (threshold: {self._thresh_error_rate}%)"
+                        ),
+                        "metric": "error_rate",
+                        "value": error_rate,
                     }
                 )
 
-        # Check for performance issues
-        if "performance" in data:
-            git_ops = data["performance"].get("git_operations", {})
-            failed_ops = sum(1 for op in git_ops.values() if not op.get("success", True))
-            total_ops = len(git_ops)
-            if total_ops > 0:
-                error_rate = (failed_ops / total_ops) * 100
-                if error_rate > thresholds["error_rate"]:
-                    alerts.append(
-                        {
-                            "level": "critical",
-                            "message": (
-                                f"High error rate detected: {error_rate:.1f}% (threshold: {thresholds['error_rate']}%)"
-                            ),
-                            "metric": "error_rate",
-                            "value": error_rate,
-                        }
-                    )
-
         return alerts
 
     def _send_alerts(self, alerts, subject_prefix="Alert"):
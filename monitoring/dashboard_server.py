@@ -6,14 +6,22 @@ This script serves the monitoring dashboard and provides real-time data
 from the analytics collector and performance monitor.
 """
 
+import concurrent.futures
+import email.utils
+import functools
+import gzip
+import hashlib
 import json
+import multiprocessing
 import os
+import signal
+import socket
 import sys
 import threading
 import time
 import urllib.parse
 from datetime import datetime
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
 
 # Add the current directory to Python path for imports
@@ -27,14 +35,133 @@ except ImportError:
     AnalyticsCollector = None
     PerformanceMonitor = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Per-endpoint TTLs (seconds) for memoized API responses
+API_CACHE_TTLS = {
+    "/api/health/status": 5,
+    "/api/git/activity": 60,
+    "/api/all": 5,
+}
+
+# Streamed JSON is flushed to the socket in chunks of roughly this many characters
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Uncached responses smaller than this are not worth compressing per request
+GZIP_MIN_SIZE = 1024
+
+# Shared across handler instances: path -> (expires_at, cached_at, encoded body)
+_response_cache = {}
+_response_cache_lock = threading.Lock()
+
+
+# Replaces the commented-out mock fetchers in dashboard.html with live API calls
+DASHBOARD_API_INJECTION = """
+                // Real API implementation
+                // One /api/all round-trip serves every fetcher within a refresh
+                let allDataRequest = null;
+                let allDataRequestedAt = 0;
+
+                async function fetchAll() {
+                    if (!allDataRequest || Date.now() - allDataRequestedAt > 5000) {
+                        allDataRequestedAt = Date.now();
+                        allDataRequest = fetch('/api/all').then(response => response.json());
+                    }
+                    return await allDataRequest;
+                }
+
+                async function fetchMetrics() {
+                    return (await fetchAll()).metrics;
+                }
+
+                async function fetchPerformanceData() {
+                    return (await fetchAll()).performance;
+                }
+
+                async function fetchUsageStats() {
+                    return (await fetchAll()).usage;
+                }
+
+                async function fetchHealthStatus() {
+                    return (await fetchAll()).health;
+                }
+
+                async function fetchGitActivity() {
+                    return (await fetchAll()).git;
+                }
+            """
+
+DASHBOARD_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard.html")
+
+
+@functools.lru_cache(maxsize=1)
+def render_dashboard():
+    """Render dashboard.html with live API calls; returns (body, gzip_body, etag)"""
+    with open(DASHBOARD_PATH, encoding="utf-8") as f:
+        content = f.read()
+
+    # Replace mock data endpoints with real API calls
+    content = content.replace(
+        "// In a real implementation, these would be API calls",
+        "// Real API calls enabled",
+    )
+    content = content.replace("</script>", DASHBOARD_API_INJECTION + "</script>")
+
+    body = content.encode()
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    return body, gzip.compress(body), etag
+
+
+def encode_json(data, pretty=False):
+    """Serialize data to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, default=str).encode()
+    return json.dumps(data, separators=(",", ":"), default=str).encode()
+
+
+def encode_cached(body):
+    """Precompute what repeat responses reuse: (body, gzip_body, etag, last_modified)"""
+    return (
+        body,
+        gzip.compress(body, compresslevel=6),
+        f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+        email.utils.formatdate(usegmt=True),
+    )
+
 
 class DashboardHandler(SimpleHTTPRequestHandler):
     """Custom HTTP handler for the dashboard"""
 
-    def __init__(self, *args, repo_path=None, **kwargs):
+    # Health deductions: (metric path, default, failing test, score deduction, alert message)
+    _HEALTH_CHECKS = (
+        (
+            ("documentation_coverage",),
+            0,
+            lambda v: v < 80,
+            10,
+            "Documentation coverage is {v:.1f}% - consider improving",
+        ),
+        (("link_health", "broken_links"), 0, lambda v: v > 0, 5, "{v} broken links detected"),
+        (("compliance_scores", "compliance_score"), 100, lambda v: v < 90, 15, "Compliance score is {v}%"),
+    )
+
+    # Keep connections open so the dashboard's polls reuse one socket;
+    # idle connections are dropped after the timeout
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+
+    def __init__(self, *args, repo_path=None, dashboard=None, analytics=None, performance=None, **kwargs):
         self.repo_path = repo_path or os.getcwd()
-        self.analytics_collector = AnalyticsCollector(self.repo_path) if AnalyticsCollector else None
-        self.performance_monitor = PerformanceMonitor(self.repo_path) if PerformanceMonitor else None
+        self.dashboard = dashboard
+        # Collectors are shared server-wide; handlers are created per request
+        self.analytics_collector = analytics
+        self.performance_monitor = performance
         super().__init__(*args, **kwargs)
 
     def do_GET(self):
@@ -50,9 +177,28 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             # Serve static files
             super().do_GET()
 
+    def copyfile(self, source, outputfile):
+        """Copy static files to the socket with zero-copy sendfile(2) when possible"""
+        try:
+            source.fileno()
+        except (AttributeError, OSError):
+            super().copyfile(source, outputfile)
+            return
+
+        # socket.sendfile uses os.sendfile where available and falls back to send()
+        outputfile.flush()
+        self.connection.sendfile(source)
+
     def handle_api_request(self, parsed_path):
         """Handle API requests for dashboard data"""
         try:
+            if (
+                parsed_path.path in API_CACHE_TTLS
+                and not self._pretty_requested()
+                and self._send_cached_response(parsed_path.path)
+            ):
+                return
+
             if parsed_path.path == "/api/metrics/latest":
                 self.serve_latest_metrics()
             elif parsed_path.path == "/api/performance/latest":
@@ -63,6 +209,8 @@ class DashboardHandler(SimpleHTTPRequestHandler):
                 self.serve_health_status()
             elif parsed_path.path == "/api/git/activity":
                 self.serve_git_activity()
+            elif parsed_path.path == "/api/all":
+                self.serve_all()
             else:
                 self.send_error(404, "API endpoint not found")
         except Exception as e:
@@ -70,58 +218,38 @@ class DashboardHandler(SimpleHTTPRequestHandler):
 
     def serve_dashboard(self):
         """Serve the main dashboard HTML"""
-        dashboard_path = os.path.join(os.path.dirname(__file__), "dashboard.html")
         try:
-            with open(dashboard_path, encoding="utf-8") as f:
-                content = f.read()
-
-            # Replace mock data endpoints with real API calls
-            content = content.replace(
-                "// In a real implementation, these would be API calls",
-                "// Real API calls enabled",
-            )
-
-            # Inject real API calls
-            api_injection = """
-                // Real API implementation
-                async function fetchMetrics() {
-                    const response = await fetch('/api/metrics/latest');
-                    return await response.json();
-                }
-
-                async function fetchPerformanceData() {
-                    const response = await fetch('/api/performance/latest');
-                    return await response.json();
-                }
-
-                async function fetchUsageStats() {
-                    const response = await fetch('/api/usage/standards');
-                    return await response.json();
-                }
-
-                async function fetchHealthStatus() {
-                    const response = await fetch('/api/health/status');
-                    return await response.json();
-                }
-
-                async function fetchGitActivity() {
-                    const response = await fetch('/api/git/activity');
-                    return await response.json();
-                }
-            """
-
-            content = content.replace("</script>", api_injection + "</script>")
-
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.send_header("Content-Length", len(content.encode()))
-            self.end_headers()
-            self.wfile.write(content.encode())
-
+            body, gzip_body, etag = render_dashboard()
         except FileNotFoundError:
             self.send_error(404, "Dashboard file not found")
+            return
         except Exception as e:
             self.send_error(500, f"Error serving dashboard: {e!s}")
+            return
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        use_gzip = self._accepts_gzip()
+        if use_gzip:
+            body = gzip_body
+
+        self.send_response(200)
+        self.send_header("Content-type", "text/html")
+        self.send_header("Content-Length", len(body))
+        self.send_header("ETag", etag)
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _accepts_gzip(self):
+        """Whether the client advertised gzip in Accept-Encoding"""
+        return "gzip" in self.headers.get("Accept-Encoding", "")
 
     def serve_latest_metrics(self):
         """Serve the latest collected metrics"""
@@ -130,8 +258,7 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             return
 
         try:
-            metrics = self.analytics_collector.collect_all_metrics()
-            self.send_json_response(metrics)
+            self._send_snapshot("metrics", self.analytics_collector.collect_all_metrics)
         except Exception as e:
             self.send_json_response({"error": f"Failed to collect metrics: {e!s}"})
 
@@ -142,145 +269,278 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             return
 
         try:
-            # Try to load latest performance report
-            latest_file = os.path.join(self.performance_monitor.metrics_dir, "latest_performance_report.json")
-            if os.path.exists(latest_file):
-                with open(latest_file) as f:
-                    data = json.load(f)
-                self.send_json_response(data)
-            else:
-                # Generate new performance report
-                report = self.performance_monitor.generate_performance_report()
-                self.send_json_response(report)
+            self._send_snapshot("performance", self._load_performance_report)
         except Exception as e:
             self.send_json_response({"error": f"Failed to get performance data: {e!s}"})
 
+    def _metrics_data(self):
+        """Return the latest metrics snapshot"""
+        if not self.analytics_collector:
+            return {"error": "Analytics collector not available"}
+        return self._snapshot("metrics", self.analytics_collector.collect_all_metrics)
+
+    def _performance_data(self):
+        """Return the latest performance snapshot"""
+        if not self.performance_monitor:
+            return self._get_mock_performance_data()
+        return self._snapshot("performance", self._load_performance_report)
+
+    def _load_performance_report(self):
+        """Load the latest saved performance report, generating one if absent"""
+        latest_file = os.path.join(self.performance_monitor.metrics_dir, "latest_performance_report.json")
+        try:
+            with open(latest_file, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return self.performance_monitor.generate_performance_report()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
     def serve_usage_stats(self):
         """Serve standards usage statistics"""
         try:
-            if self.analytics_collector:
-                standards_metrics = self.analytics_collector.collect_standards_usage_metrics()
-
-                # Process for dashboard display
-                usage_data = {
-                    "standards": [],
-                    "usage_counts": [],
-                    "file_sizes": [],
-                    "last_modified": [],
-                }
+            self.send_json_response(self._usage_data())
+        except Exception as e:
+            self.send_json_response({"error": f"Failed to get usage stats: {e!s}"})
 
-                for std_id, metrics in standards_metrics.items():
-                    usage_data["standards"].append(std_id)
-                    usage_data["usage_counts"].append(metrics.get("line_count", 0))
-                    usage_data["file_sizes"].append(metrics.get("file_size", 0))
-                    usage_data["last_modified"].append(metrics.get("last_modified", ""))
+    def _usage_data(self):
+        """Build the standards usage payload"""
+        if not self.analytics_collector:
+            return self._get_mock_usage_data()
 
-                self.send_json_response(usage_data)
-            else:
-                self.send_json_response(self._get_mock_usage_data())
+        standards_metrics = self._snapshot("usage", self.analytics_collector.collect_standards_usage_metrics)
 
-        except Exception as e:
-            self.send_json_response({"error": f"Failed to get usage stats: {e!s}"})
+        # Process for dashboard display: build rows once, then transpose into columns
+        rows = [
+            (std_id, metrics.get("line_count", 0), metrics.get("file_size", 0), metrics.get("last_modified", ""))
+            for std_id, metrics in standards_metrics.items()
+        ]
+        columns = [list(column) for column in zip(*rows, strict=True)] if rows else [[], [], [], []]
+        standards, usage_counts, file_sizes, last_modified = columns
+
+        return {
+            "standards": standards,
+            "usage_counts": usage_counts,
+            "file_sizes": file_sizes,
+            "last_modified": last_modified,
+        }
 
     def serve_health_status(self):
         """Serve repository health status"""
         try:
-            if self.analytics_collector:
-                health_metrics = self.analytics_collector.collect_repository_health_metrics()
-
-                # Calculate overall health score
-                health_score = 100
-                alerts = []
-
-                # Check documentation coverage
-                doc_coverage = health_metrics.get("documentation_coverage", 0)
-                if doc_coverage < 80:
-                    health_score -= 10
-                    alerts.append(
-                        {
-                            "type": "warning",
-                            "message": f"Documentation coverage is {doc_coverage:.1f}% - consider improving",
-                        }
-                    )
-
-                # Check link health
-                link_health = health_metrics.get("link_health", {})
-                if link_health.get("broken_links", 0) > 0:
-                    health_score -= 5
-                    alerts.append(
-                        {
-                            "type": "warning",
-                            "message": f"{link_health.get('broken_links', 0)} broken links detected",
-                        }
-                    )
-
-                # Check compliance scores
-                compliance = health_metrics.get("compliance_scores", {})
-                if compliance.get("compliance_score", 100) < 90:
-                    health_score -= 15
-                    alerts.append(
-                        {
-                            "type": "warning",
-                            "message": f"Compliance score is {compliance.get('compliance_score', 'unknown')}%",
-                        }
-                    )
-
-                if health_score >= 90:
-                    alerts.insert(
-                        0,
-                        {
-                            "type": "success",
-                            "message": "All systems operational - repository health excellent",
-                        },
-                    )
-
-                health_data = {
-                    "overall_health": max(health_score, 0),
-                    "documentation_coverage": doc_coverage,
-                    "link_health": link_health.get("health_score", 100),
-                    "compliance_score": compliance.get("compliance_score", 100),
-                    "alerts": alerts,
-                    "last_updated": datetime.now().isoformat(),
-                }
-
-                self.send_json_response(health_data)
-            else:
-                self.send_json_response(self._get_mock_health_data())
-
+            cache_key = "/api/health/status" if self.analytics_collector else None
+            self.send_json_response(self._health_data(), cache_key=cache_key)
         except Exception as e:
             self.send_json_response({"error": f"Failed to get health status: {e!s}"})
 
+    def _health_data(self):
+        """Build the repository health payload"""
+        if not self.analytics_collector:
+            return self._get_mock_health_data()
+
+        health_metrics = self._snapshot("health", self.analytics_collector.collect_repository_health_metrics)
+
+        # Calculate overall health score
+        health_score = 100
+        alerts = []
+        values = {}
+
+        for path, default, failing, deduction, message in self._HEALTH_CHECKS:
+            section = health_metrics
+            for key in path[:-1]:
+                section = section.get(key, {})
+            value = values[path] = section.get(path[-1], default)
+            if failing(value):
+                health_score -= deduction
+                alerts.append({"type": "warning", "message": message.format(v=value)})
+
+        if health_score >= 90:
+            alerts.insert(
+                0,
+                {
+                    "type": "success",
+                    "message": "All systems operational - repository health excellent",
+                },
+            )
+
+        return {
+            "overall_health": max(health_score, 0),
+            "documentation_coverage": values[("documentation_coverage",)],
+            "link_health": health_metrics.get("link_health", {}).get("health_score", 100),
+            "compliance_score": values[("compliance_scores", "compliance_score")],
+            "alerts": alerts,
+            "last_updated": datetime.now().isoformat(),
+        }
+
     def serve_git_activity(self):
         """Serve Git activity data"""
         try:
-            if self.analytics_collector:
-                git_metrics = self.analytics_collector.collect_git_metrics()
-
-                # Format for dashboard
-                activity_data = {
-                    "commits_7_days": git_metrics.get("commits", {}).get("last_7_days", 0),
-                    "commits_30_days": git_metrics.get("commits", {}).get("last_30_days", 0),
-                    "contributors": git_metrics.get("contributors", {}),
-                    "file_changes": git_metrics.get("file_changes", {}),
-                    "branches": git_metrics.get("branches", {}),
-                }
-
-                self.send_json_response(activity_data)
-            else:
-                self.send_json_response(self._get_mock_git_data())
-
+            cache_key = "/api/git/activity" if self.analytics_collector else None
+            self.send_json_response(self._git_data(), cache_key=cache_key)
         except Exception as e:
             self.send_json_response({"error": f"Failed to get git activity: {e!s}"})
 
-    def send_json_response(self, data):
-        """Send JSON response"""
-        json_data = json.dumps(data, indent=2, default=str)
+    def _git_data(self):
+        """Build the Git activity payload"""
+        if not self.analytics_collector:
+            return self._get_mock_git_data()
+
+        git_metrics = self._snapshot("git", self.analytics_collector.collect_git_metrics)
+
+        # Format for dashboard
+        return {
+            "commits_7_days": git_metrics.get("commits", {}).get("last_7_days", 0),
+            "commits_30_days": git_metrics.get("commits", {}).get("last_30_days", 0),
+            "contributors": git_metrics.get("contributors", {}),
+            "file_changes": git_metrics.get("file_changes", {}),
+            "branches": git_metrics.get("branches", {}),
+        }
+
+    def serve_all(self):
+        """Serve every dashboard dataset in a single response"""
+        sections = {
+            "metrics": self._metrics_data,
+            "performance": self._performance_data,
+            "usage": self._usage_data,
+            "health": self._health_data,
+            "git": self._git_data,
+        }
+
+        data = {}
+        for name, build in sections.items():
+            try:
+                data[name] = build()
+            except Exception as e:
+                data[name] = {"error": f"Failed to get {name} data: {e!s}"}
+
+        cache_key = "/api/all" if self.analytics_collector else None
+        self.send_json_response(data, cache_key=cache_key)
+
+    def _snapshot(self, key, collect):
+        """Read data from the server's shared snapshot, collecting directly if standalone"""
+        if self.dashboard is None:
+            return collect()
+        return self.dashboard.get_snapshot(key, collect)
+
+    def _send_snapshot(self, key, collect):
+        """Send a snapshot as-is, reusing its pre-serialized bytes when possible"""
+        if self.dashboard is None or self._pretty_requested():
+            # Full snapshots can be large; stream them rather than building one string
+            self.send_json_stream(self._snapshot(key, collect), pretty=self._pretty_requested())
+            return
+        self._write_json_body(*self.dashboard.get_snapshot_bytes(key, collect))
+
+    def _pretty_requested(self):
+        """Whether the client asked for indented JSON via ?pretty=1"""
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        return query.get("pretty") == ["1"]
+
+    def send_json_response(self, data, cache_key=None):
+        """Send compact JSON (indented with ?pretty=1), optionally memoizing it for the endpoint's TTL"""
+        pretty = self._pretty_requested()
+        if pretty:
+            # The cache only holds the compact form
+            cache_key = None
+
+        if cache_key and isinstance(data, dict) and "last_updated" not in data:
+            # Copy rather than mutate: data may be a snapshot shared across threads
+            data = {**data, "last_updated": datetime.now().isoformat()}
+        body = encode_json(data, pretty=pretty)
+
+        if not cache_key:
+            self._write_json_body(body)
+            return
+
+        # Compress and hash once here so every cache hit can reuse them
+        encoded = encode_cached(body)
+        now = time.monotonic()
+        with _response_cache_lock:
+            _response_cache[cache_key] = (now + API_CACHE_TTLS[cache_key], now, encoded)
+        self._write_json_body(*encoded)
+
+    def send_json_stream(self, data, pretty=False):
+        """Send JSON incrementally with chunked transfer encoding"""
+        encoder = json.JSONEncoder(
+            indent=2 if pretty else None,
+            separators=None if pretty else (",", ":"),
+            default=str,
+        )
+
+        if self.request_version < "HTTP/1.1":
+            # Chunked encoding is HTTP/1.1 only
+            self._write_json_body(encoder.encode(data).encode())
+            return
+
+        self.send_response(200)
+        self.send_header("Content-type", "application/json")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        pending = []
+        pending_size = 0
+        for fragment in encoder.iterencode(data):
+            pending.append(fragment)
+            pending_size += len(fragment)
+            if pending_size >= STREAM_CHUNK_SIZE:
+                self._write_chunk("".join(pending).encode())
+                pending.clear()
+                pending_size = 0
+        if pending:
+            self._write_chunk("".join(pending).encode())
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, chunk):
+        """Write one chunk of a chunked-encoding response"""
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+
+    def _send_cached_response(self, path):
+        """Send a memoized response for path if one is still fresh"""
+        now = time.monotonic()
+        with _response_cache_lock:
+            entry = _response_cache.get(path)
+        if entry is None or entry[0] <= now:
+            return False
+
+        _, cached_at, encoded = entry
+        self._write_json_body(*encoded, age=int(now - cached_at))
+        return True
+
+    def _write_json_body(self, body, gzip_body=None, etag=None, last_modified=None, age=None):
+        """Write already-encoded JSON with standard API headers"""
+        if etag and self._not_modified(etag, last_modified):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        use_gzip = self._accepts_gzip() and (gzip_body is not None or len(body) >= GZIP_MIN_SIZE)
+        if use_gzip:
+            body = gzip_body if gzip_body is not None else gzip.compress(body, compresslevel=6)
+
         self.send_response(200)
         self.send_header("Content-type", "application/json")
         self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Content-Length", len(json_data.encode()))
+        self.send_header("Content-Length", len(body))
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Connection", "keep-alive")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+        if age is not None:
+            self.send_header("Age", str(age))
         self.end_headers()
-        self.wfile.write(json_data.encode())
+        self.wfile.write(body)
+
+    def _not_modified(self, etag, last_modified):
+        """Whether the client's cached copy is current (If-None-Match wins over If-Modified-Since)"""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return if_none_match == etag
+        return self.headers.get("If-Modified-Since") == last_modified
 
     def _get_mock_performance_data(self):
         """Return mock performance data when real collector is not available"""
@@ -336,84 +596,274 @@ class DashboardHandler(SimpleHTTPRequestHandler):
         }
 
 
+def _collect_all_metrics(repo_path):
+    """Run a full analytics collection (executed in a worker process)"""
+    return AnalyticsCollector(repo_path).collect_all_metrics()
+
+
+def _generate_performance_report(repo_path):
+    """Run a full performance report (executed in a worker process)"""
+    return PerformanceMonitor(repo_path).generate_performance_report()
+
+
+class _DashboardHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server whose handler threads never block shutdown"""
+
+    daemon_threads = True
+
+    def __init__(self, server_address, handler_class, reuse_port=False):
+        self.reuse_port = reuse_port
+        super().__init__(server_address, handler_class)
+
+    def server_bind(self):
+        if self.reuse_port:
+            # Several worker processes accept on one port; the kernel balances connections
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
 class DashboardServer:
     """Main dashboard server class"""
 
-    def __init__(self, repo_path=None, port=8080, host="localhost"):
+    def __init__(self, repo_path=None, port=8080, host="localhost", workers=1):
         self.repo_path = repo_path or os.getcwd()
         self.port = port
         self.host = host
+        self.workers = workers
+        self._is_primary = True
+        self._worker_pids = []
         self.httpd = None
+        self.analytics = None
+        self.performance = None
         self.monitoring_thread = None
-        self.stop_monitoring = False
+        self._executor = None
+        self._stop_event = threading.Event()
+
+        # Latest background-collected data shared with request handlers
+        self.snapshots = {
+            "metrics": None,
+            "performance": None,
+            "health": None,
+            "git": None,
+            "usage": None,
+            "metrics_encoded": None,
+            "performance_encoded": None,
+            "ts": 0,
+        }
+        self.snapshot_lock = threading.RLock()
+        self._inflight = {}
 
     def start(self):
         """Start the dashboard server"""
+        workers = self.workers
+        if workers > 1 and not (hasattr(socket, "SO_REUSEPORT") and hasattr(os, "fork")):
+            print("⚠️ Multiple workers need SO_REUSEPORT and fork(); running a single process")
+            workers = 1
+
+        # Fork extra workers before any threads exist; each binds its own listening socket
+        for _ in range(workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                self._is_primary = False
+                self._worker_pids = []
+                break
+            self._worker_pids.append(pid)
+
         # Change to the monitoring directory to serve static files
         monitoring_dir = os.path.join(self.repo_path, "monitoring")
         os.chdir(monitoring_dir)
 
-        # Create custom handler with repo path
-        def handler_class(*args, **kwargs):
-            return DashboardHandler(*args, repo_path=self.repo_path, **kwargs)
-
-        # Start HTTP server
-        self.httpd = HTTPServer((self.host, self.port), handler_class)
-
-        print(f"🚀 Dashboard server starting on http://{self.host}:{self.port}")
-        print(f"📊 Dashboard available at: http://{self.host}:{self.port}/dashboard")
-        print(f"🔗 API endpoints available at: http://{self.host}:{self.port}/api/")
-        print("Press Ctrl+C to stop the server")
-
-        # Start background monitoring
-        self.start_background_monitoring()
+        # Collectors are created once and shared by every request handler
+        self.analytics = AnalyticsCollector(self.repo_path) if AnalyticsCollector else None
+        self.performance = PerformanceMonitor(self.repo_path) if PerformanceMonitor else None
+
+        handler_class = functools.partial(
+            DashboardHandler,
+            repo_path=self.repo_path,
+            dashboard=self,
+            analytics=self.analytics,
+            performance=self.performance,
+        )
+
+        # Start HTTP server; each request gets its own thread so a slow
+        # collector run or file read does not stall other dashboard polls
+        self.httpd = _DashboardHTTPServer((self.host, self.port), handler_class, reuse_port=workers > 1)
+
+        if self._is_primary:
+            print(f"🚀 Dashboard server starting on http://{self.host}:{self.port} ({workers} worker(s))")
+            print(f"📊 Dashboard available at: http://{self.host}:{self.port}/dashboard")
+            print(f"🔗 API endpoints available at: http://{self.host}:{self.port}/api/")
+            print("Press Ctrl+C to stop the server")
+
+            # Start background monitoring
+            self.start_background_monitoring()
+        else:
+            # Secondary workers pick up what the primary's collectors save to disk
+            self.start_snapshot_follower()
 
         try:
             self.httpd.serve_forever()
         except KeyboardInterrupt:
-            print("\n🛑 Stopping dashboard server...")
+            if self._is_primary:
+                print("\n🛑 Stopping dashboard server...")
             self.stop()
 
     def stop(self):
         """Stop the dashboard server"""
-        self.stop_monitoring = True
+        self._stop_event.set()
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=5)
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
         if self.httpd:
             self.httpd.shutdown()
             self.httpd.server_close()
-        print("✅ Dashboard server stopped")
+        for pid in self._worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        if self._is_primary:
+            print("✅ Dashboard server stopped")
+
+    def get_snapshot(self, key, collect):
+        """Return snapshot data for key, filling it via collect() if not yet available"""
+        with self.snapshot_lock:
+            data = self.snapshots[key]
+            if data is not None:
+                return data
+            # Single-flight: concurrent misses on one key share a single collect()
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            data = collect()
+        except Exception as e:
+            with self.snapshot_lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+
+        with self.snapshot_lock:
+            self.snapshots[key] = data
+            del self._inflight[key]
+        future.set_result(data)
+        return data
+
+    def get_snapshot_bytes(self, key, collect):
+        """Return encode_cached() output for a snapshot, encoding once per update"""
+        with self.snapshot_lock:
+            encoded = self.snapshots[f"{key}_encoded"]
+        if encoded is not None:
+            return encoded
+
+        # Collect outside the lock so other snapshots stay readable meanwhile
+        data = self.get_snapshot(key, collect)
+        with self.snapshot_lock:
+            if self.snapshots[f"{key}_encoded"] is None:
+                self._store_encoded(key, data)
+            return self.snapshots[f"{key}_encoded"]
+
+    def _store_encoded(self, key, data):
+        """Cache the encoded forms of a snapshot (lock must be held)"""
+        self.snapshots[f"{key}_encoded"] = encode_cached(encode_json(data))
+
+    def update_snapshots(self, metrics=None, performance=None):
+        """Publish freshly collected metrics and performance data to handlers"""
+        with self.snapshot_lock:
+            if metrics is not None:
+                self.snapshots["metrics"] = metrics
+                self._store_encoded("metrics", metrics)
+                self.snapshots["git"] = metrics.get("git_metrics")
+                self.snapshots["health"] = metrics.get("health_metrics")
+                self.snapshots["usage"] = metrics.get("standards_metrics")
+            if performance is not None:
+                self.snapshots["performance"] = performance
+                self._store_encoded("performance", performance)
+            self.snapshots["ts"] = time.time()
 
     def start_background_monitoring(self):
         """Start background monitoring thread"""
         if AnalyticsCollector and PerformanceMonitor:
+            self._executor = self._create_collector_executor()
             self.monitoring_thread = threading.Thread(target=self._background_monitoring)
             self.monitoring_thread.daemon = True
             self.monitoring_thread.start()
             print("📈 Background monitoring started")
 
+    def start_snapshot_follower(self):
+        """Start the thread that loads snapshots saved by the primary worker"""
+        if AnalyticsCollector:
+            self.monitoring_thread = threading.Thread(target=self._follow_saved_snapshots)
+            self.monitoring_thread.daemon = True
+            self.monitoring_thread.start()
+
+    def _follow_saved_snapshots(self):
+        """Reload the latest saved metrics and performance reports whenever they change"""
+        metrics_dir = os.path.join(self.repo_path, "monitoring", "metrics")
+        metrics_file = os.path.join(metrics_dir, "latest_metrics.json")
+        performance_file = os.path.join(metrics_dir, "latest_performance_report.json")
+        mtimes = {}
+
+        while not self._stop_event.is_set():
+            metrics = self._read_if_changed(metrics_file, mtimes)
+            performance = self._read_if_changed(performance_file, mtimes)
+            if metrics is not None or performance is not None:
+                self.update_snapshots(metrics=metrics, performance=performance)
+            self._stop_event.wait(30)
+
+    @staticmethod
+    def _read_if_changed(path, mtimes):
+        """Parse a saved JSON report if its mtime differs from the last read"""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            if mtimes.get(path) == mtime:
+                return None
+            with open(path, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
+            # Missing, or caught mid-write by the primary; retry next round
+            return None
+        mtimes[path] = mtime
+        return data
+
+    @staticmethod
+    def _create_collector_executor():
+        """Create the pool that runs collectors off the request-serving process"""
+        try:
+            # spawn avoids forking a process that already has serving threads
+            return concurrent.futures.ProcessPoolExecutor(
+                max_workers=2, mp_context=multiprocessing.get_context("spawn")
+            )
+        except (OSError, NotImplementedError):
+            # Platforms without working multiprocessing still overlap the I/O waits
+            return concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
     def _background_monitoring(self):
         """Background monitoring loop"""
-        analytics = AnalyticsCollector(self.repo_path)
-        performance = PerformanceMonitor(self.repo_path)
-
-        while not self.stop_monitoring:
+        while not self._stop_event.is_set():
             try:
-                # Collect metrics every 5 minutes
-                analytics.collect_all_metrics()
-                performance.generate_performance_report()
+                # Collect metrics every 5 minutes, running both collectors in parallel
+                metrics_future = self._executor.submit(_collect_all_metrics, self.repo_path)
+                report_future = self._executor.submit(_generate_performance_report, self.repo_path)
+                self.update_snapshots(metrics=metrics_future.result(), performance=report_future.result())
 
                 print(f"📊 Metrics updated at {datetime.now().strftime('%H:%M:%S')}")
 
-                # Wait 5 minutes
-                for _ in range(300):  # 5 minutes = 300 seconds
-                    if self.stop_monitoring:
-                        break
-                    time.sleep(1)
+                # Wait 5 minutes, waking immediately on shutdown
+                self._stop_event.wait(300)
 
             except Exception as e:
                 print(f"⚠️ Error in background monitoring: {e}")
-                time.sleep(60)  # Wait 1 minute before retrying
+                self._stop_event.wait(60)  # Wait 1 minute before retrying
 
 
 def main():
@@ -423,10 +873,16 @@ def main():
     parser.add_argument("--port", type=int, default=8080, help="Port to serve on (default: 8080)")
     parser.add_argument("--host", default="localhost", help="Host to bind to (default: localhost)")
     parser.add_argument("--repo-path", help="Path to repository (default: current directory)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes sharing the port via SO_REUSEPORT (default: 1)",
+    )
 
     args = parser.parse_args()
 
-    server = DashboardServer(repo_path=args.repo_path, port=args.port, host=args.host)
+    server = DashboardServer(repo_path=args.repo_path, port=args.port, host=args.host, workers=args.workers)
 
     try:
         server.start()
@@ -7,18 +7,86 @@ including file integrity, dependency tracking, validation status, and automated
 health checks with alerting.
 """
 
+import importlib.util
 import json
 import logging
+import math
+import operator
 import os
 import re
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cache, partial
+from itertools import chain, islice
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
+from types import MappingProxyType
 
 import psutil
 import yaml
 
 
+try:
+    from math import sumprod as _sumprod
+except ImportError:  # Python < 3.12
+
+    def _sumprod(p, q):
+        return math.fsum(map(operator.mul, p, q))
+
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Patterns used inside per-file and per-line loops, compiled once at import
+# Matched against raw file bytes; only captured groups are decoded
+_LINK_RE = re.compile(rb"\[([^\]]+)\]\(([^)]+)\)")
+_IMPORT_RE = re.compile(r"import\s+(\w+)")
+_SECRET_RE = re.compile(r"""(?:password|api_key|secret|token)\s*=\s*["'][^"']+["']""", re.IGNORECASE)
+_REQUIRED_SECTIONS = ("## Overview", "## Implementation", "## Examples")
+_SECTIONS_RE = re.compile("|".join(re.escape(s) for s in _REQUIRED_SECTIONS))
+
+# Contribution of each check to the overall health score; unknown checks weigh 0.1
+_CHECK_WEIGHTS = MappingProxyType(
+    {
+        "file_integrity": 0.2,
+        "dependency_validation": 0.15,
+        "link_validation": 0.1,
+        "standards_consistency": 0.2,
+        "git_health": 0.15,
+        "system_resources": 0.1,
+        "security_validation": 0.05,
+        "compliance_checking": 0.05,
+    }
+)
+
+# Directories the repository scan does not descend into
+_SCAN_SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__"})
+
+# Files above this size are reported by the git health check
+_LARGE_FILE_BYTES = 10 * 1024 * 1024
+
+# Suffix -> scan bucket for files collected in the single repository walk
+_SCAN_SUFFIXES = {".py": "py", ".md": "md", ".js": "js", ".ts": "ts"}
+
+# Sensitive file names (.env*, id_rsa*, *password*, *secret*, *.key, *.pem) as one
+# alternation: anchored prefixes first, then the substring and suffix forms
+_SENSITIVE_RE = re.compile(r"\.env|id_rsa|.*(?:password|secret)|.*\.(?:key|pem)\Z", re.DOTALL)
+
+
+@cache
+def _load_compliance_module(script_path):
+    """Import scripts/calculate_compliance_score.py once per path"""
+    spec = importlib.util.spec_from_file_location("_calculate_compliance_score", script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 class HealthMonitor:
     """Comprehensive repository health monitoring system"""
 
@@ -32,13 +100,15 @@ class HealthMonitor:
         for dir_path in [self.health_dir, self.logs_dir]:
             os.makedirs(dir_path, exist_ok=True)
 
-        # Setup logging
-        logging.basicConfig(
-            filename=os.path.join(self.logs_dir, "health_monitor.log"),
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-        )
+        # Setup logging; INFO records are buffered and written once per check run
         self.logger = logging.getLogger(__name__)
+        if not self.logger.handlers:
+            file_handler = RotatingFileHandler(
+                os.path.join(self.logs_dir, "health_monitor.log"), maxBytes=5 * 1024 * 1024, backupCount=3
+            )
+            file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+            self.logger.addHandler(MemoryHandler(capacity=64, flushLevel=logging.ERROR, target=file_handler))
+            self.logger.setLevel(logging.INFO)
 
         # Health check configuration
         self.health_checks = {
@@ -52,6 +122,18 @@ class HealthMonitor:
             "compliance_checking": True,
         }
 
+        # Files classified by type plus absolute paths of every file and
+        # directory, built by one walk per health check run
+        self._scan = None
+
+        # Parsed YAML documents keyed by path, reused while the mtime is unchanged
+        self._yaml_cache = {}
+
+        # Seed psutil's CPU counters so later samples measure the interval since
+        # this point instead of blocking for a fresh one
+        psutil.cpu_percent(interval=None)
+        self._cpu_sampled_at = time.monotonic()
+
         # Health thresholds
         self.thresholds = {
             "critical": {
@@ -85,30 +167,13 @@ class HealthMonitor:
             "recommendations": [],
         }
 
-        # Run individual health checks
-        if self.health_checks["file_integrity"]:
-            health_report["checks"]["file_integrity"] = self._check_file_integrity()
-
-        if self.health_checks["dependency_validation"]:
-            health_report["checks"]["dependency_validation"] = self._check_dependencies()
+        scan = self._scan = self._scan_repo()
 
-        if self.health_checks["link_validation"]:
-            health_report["checks"]["link_validation"] = self._check_links()
-
-        if self.health_checks["standards_consistency"]:
-            health_report["checks"]["standards_consistency"] = self._check_standards_consistency()
-
-        if self.health_checks["git_health"]:
-            health_report["checks"]["git_health"] = self._check_git_health()
-
-        if self.health_checks["system_resources"]:
-            health_report["checks"]["system_resources"] = self._check_system_resources()
-
-        if self.health_checks["security_validation"]:
-            health_report["checks"]["security_validation"] = self._check_security()
-
-        if self.health_checks["compliance_checking"]:
-            health_report["checks"]["compliance_checking"] = self._check_compliance()
+        # Checks share no state beyond the scan, so their I/O waits overlap
+        enabled_checks = self._enabled_checks(scan)
+        with ThreadPoolExecutor(max_workers=max(1, len(enabled_checks))) as executor:
+            futures = {name: executor.submit(check) for name, check in enabled_checks}
+            health_report["checks"] = {name: future.result() for name, future in futures.items()}
 
         # Calculate overall health score and status
         health_report = self._calculate_overall_health(health_report)
@@ -117,12 +182,136 @@ class HealthMonitor:
         self._save_health_report(health_report)
 
         self.logger.info(
-            f"Health check completed. Overall status: {health_report['overall_status']}, "
-            f"Score: {health_report['health_score']}"
+            "Health check completed. Overall status: %s, Score: %s",
+            health_report["overall_status"],
+            health_report["health_score"],
         )
+        for handler in self.logger.handlers:
+            handler.flush()
 
         return health_report
 
+    def _enabled_checks(self, scan):
+        """Return (name, callable) pairs for every enabled health check"""
+        checks = [
+            ("file_integrity", self._check_file_integrity),
+            ("dependency_validation", partial(self._check_dependencies, scan)),
+            ("link_validation", partial(self._check_links, scan)),
+            ("standards_consistency", self._check_standards_consistency),
+            ("git_health", self._check_git_health),
+            ("system_resources", self._check_system_resources),
+            ("security_validation", partial(self._check_security, scan)),
+            ("compliance_checking", self._check_compliance),
+        ]
+        return [(name, check) for name, check in checks if self.health_checks[name]]
+
+    def _scan_repo(self):
+        """Walk the repository once, classifying files and indexing every path"""
+        scan = {
+            "py": [],
+            "md": [],
+            "js": [],
+            "ts": [],
+            "pkg_json": [],
+            "requirements": [],
+            "sensitive": [],
+            "files": [],
+            "large": [],
+            "executable": [],
+            "paths": {os.path.abspath(self.repo_path)},
+        }
+        paths = scan["paths"]
+
+        # os.scandir entries expose file type without a stat(); size and mode
+        # bits for the large-file and executable checks share one lstat per file
+        pending = [self.repo_path]
+        while pending:
+            root = pending.pop()
+            try:
+                with os.scandir(root) as entries:
+                    entries = list(entries)
+            except OSError:
+                continue
+
+            abs_root = os.path.abspath(root)
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                paths.add(os.path.join(abs_root, name))
+
+                if entry.is_dir():
+                    if name in _SCAN_SKIP_DIRS:
+                        continue
+                    # Sensitive-name patterns apply to directories as well as files
+                    if _SENSITIVE_RE.match(name):
+                        scan["sensitive"].append(Path(entry.path))
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+
+                file_path = Path(entry.path)
+                scan["files"].append(file_path)
+
+                bucket = _SCAN_SUFFIXES.get(os.path.splitext(name)[1])
+                if bucket:
+                    scan[bucket].append(file_path)
+                if name == "package.json":
+                    scan["pkg_json"].append(file_path)
+                elif name.startswith("requirements") and name.endswith(".txt"):
+                    scan["requirements"].append(file_path)
+                if _SENSITIVE_RE.match(name):
+                    scan["sensitive"].append(file_path)
+
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        if st.st_size > _LARGE_FILE_BYTES:
+                            scan["large"].append(os.path.relpath(entry.path, self.repo_path))
+                        if st.st_mode & 0o111:
+                            scan["executable"].append(file_path)
+                except OSError:
+                    pass
+
+            # Reversed so subdirectories pop in listing order, matching os.walk
+            pending.extend(reversed(subdirs))
+
+        return scan
+
+    def _get_scan(self):
+        """Return the current repository scan, walking the tree if none exists yet"""
+        if self._scan is None:
+            self._scan = self._scan_repo()
+        return self._scan
+
+    def _path_exists(self, path):
+        """Check existence against the scanned path index, falling back to stat() where it has no coverage"""
+        path = os.path.abspath(path)
+        root_path = os.path.abspath(self.repo_path)
+        if path != root_path and not path.startswith(root_path + os.sep):
+            return os.path.exists(path)
+        if path in self._get_scan()["paths"]:
+            return True
+        # Contents of pruned directories are not indexed
+        if _SCAN_SKIP_DIRS.intersection(os.path.relpath(path, root_path).split(os.sep)):
+            return os.path.exists(path)
+        return False
+
+    def _load_yaml(self, path):
+        """Parse a YAML file with the C loader when available, memoized on its mtime"""
+        key = os.stat(path).st_mtime_ns
+        cached = self._yaml_cache.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        with open(path, encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
+        self._yaml_cache[path] = (key, data)
+        return data
+
+    def _get_manifest(self):
+        """Return the parsed config/MANIFEST.yaml, reparsed only when its mtime changes"""
+        return self._load_yaml(os.path.join(self.repo_path, "config", "MANIFEST.yaml"))
+
     def _check_file_integrity(self):
         """Check integrity of critical files"""
         check_result = {"status": "healthy", "score": 100, "details": {}, "issues": []}
@@ -142,27 +331,25 @@ class HealthMonitor:
         for file_path in critical_files:
             full_path = os.path.join(self.repo_path, file_path)
 
-            if not os.path.exists(full_path):
-                missing_files.append(file_path)
-                continue
-
             try:
-                # Check if file is readable and has content
-                with open(full_path, encoding="utf-8") as f:
-                    content = f.read()
-                    if len(content) < 100:  # Files should have substantial content
-                        corrupted_files.append(f"{file_path} (too small)")
+                # Size comes from the inode; content is only read where a check needs it
+                if os.stat(full_path).st_size < 100:  # Files should have substantial content
+                    corrupted_files.append(f"{file_path} (too small)")
 
-                    # Basic format validation for key files
-                    if file_path.endswith(".md") and not content.startswith("#"):
-                        corrupted_files.append(f"{file_path} (invalid markdown format)")
+                # Basic format validation for key files
+                if file_path.endswith(".md"):
+                    with open(full_path, "rb") as f:
+                        if f.read(1) != b"#":
+                            corrupted_files.append(f"{file_path} (invalid markdown format)")
 
-                    if file_path.endswith(".yaml") or file_path.endswith(".yml"):
-                        try:
-                            yaml.safe_load(content)
-                        except yaml.YAMLError:
-                            corrupted_files.append(f"{file_path} (invalid YAML)")
+                if file_path.endswith(".yaml") or file_path.endswith(".yml"):
+                    try:
+                        self._load_yaml(full_path)
+                    except yaml.YAMLError:
+                        corrupted_files.append(f"{file_path} (invalid YAML)")
 
+            except FileNotFoundError:
+                missing_files.append(file_path)
             except Exception as e:
                 corrupted_files.append(f"{file_path} (read error: {e!s})")
 
@@ -193,28 +380,29 @@ class HealthMonitor:
 
         return check_result
 
-    def _check_dependencies(self):
+    def _check_dependencies(self, scan=None):
         """Check for dependency issues in the repository"""
         check_result = {"status": "healthy", "score": 100, "details": {}, "issues": []}
+        scan = scan or self._get_scan()
 
         dependency_issues = []
 
         # Check Python dependencies
-        python_files = list(Path(self.repo_path).rglob("*.py"))
-        requirements_files = list(Path(self.repo_path).rglob("requirements*.txt"))
+        python_files = scan["py"]
+        requirements_files = scan["requirements"]
 
         if python_files and not requirements_files:
             dependency_issues.append("Python files found but no requirements.txt")
 
         # Check for common import issues in Python files
         import_errors = []
-        for py_file in python_files[:10]:  # Check first 10 Python files
+        for py_file in islice(python_files, 10):  # Check first 10 Python files
             try:
                 with open(py_file, encoding="utf-8") as f:
                     content = f.read()
 
                 # Look for common problematic imports
-                problematic_imports = re.findall(r"import\s+(\w+)", content)
+                problematic_imports = _IMPORT_RE.findall(content)
                 for imp in problematic_imports:
                     if imp in ["requests", "pandas", "numpy"] and not requirements_files:
                         import_errors.append(f"{py_file.name} imports {imp} but no requirements.txt")
@@ -223,8 +411,8 @@ class HealthMonitor:
                 continue
 
         # Check Node.js dependencies if applicable
-        package_json_files = list(Path(self.repo_path).rglob("package.json"))
-        js_files = list(Path(self.repo_path).rglob("*.js")) + list(Path(self.repo_path).rglob("*.ts"))
+        package_json_files = scan["pkg_json"]
+        js_files = scan["js"] + scan["ts"]
 
         if js_files and not package_json_files:
             dependency_issues.append("JavaScript/TypeScript files found but no package.json")
@@ -232,7 +420,7 @@ class HealthMonitor:
         # Check for missing node_modules if package.json exists
         for package_json in package_json_files:
             node_modules = package_json.parent / "node_modules"
-            if not node_modules.exists():
+            if not self._path_exists(str(node_modules)):
                 dependency_issues.append(f"Missing node_modules for {package_json}")
 
         # Calculate score
@@ -258,55 +446,54 @@ class HealthMonitor:
 
         return check_result
 
-    def _check_links(self):
+    def _check_links(self, scan=None):
         """Check for broken internal links"""
         check_result = {"status": "healthy", "score": 100, "details": {}, "issues": []}
+        scan = scan or self._get_scan()
 
-        markdown_files = list(Path(self.repo_path).rglob("*.md"))
+        markdown_files = scan["md"]
         total_links = 0
-        broken_links = []
+        # Parallel columns per broken link; only the first few become dicts in the details
+        broken_files = []
+        broken_urls = []
+        broken_texts = []
 
         for md_file in markdown_files:
             try:
-                with open(md_file, encoding="utf-8") as f:
-                    content = f.read()
+                content = md_file.read_bytes()
+                md_dir = os.path.dirname(md_file)
 
                 # Find markdown links
-                link_pattern = r"\[([^\]]+)\]\(([^)]+)\)"
-                links = re.findall(link_pattern, content)
-
-                for link_text, link_url in links:
+                for match in _LINK_RE.finditer(content):
                     total_links += 1
+                    link_url = match[2].decode("utf-8", "replace")
 
                     # Check internal links (relative paths)
-                    if link_url.startswith("./") or link_url.startswith("../") or not link_url.startswith("http"):
-                        # Convert to absolute path
-                        if link_url.startswith("./"):
-                            link_path = md_file.parent / link_url[2:]
-                        elif link_url.startswith("../"):
-                            link_path = md_file.parent / link_url
-                        else:
-                            link_path = Path(self.repo_path) / link_url
-
-                        # Remove anchor if present
-                        if "#" in str(link_path):
-                            link_path = Path(str(link_path).split("#")[0])
-
-                        if not link_path.exists():
-                            broken_links.append(
-                                {
-                                    "file": str(md_file.relative_to(self.repo_path)),
-                                    "link": link_url,
-                                    "text": link_text,
-                                }
-                            )
+                    if link_url.startswith("http"):
+                        continue
+
+                    # Resolve against the file for ./ and ../ links, else the repo root; drop any anchor
+                    target = link_url.partition("#")[0]
+                    if target.startswith("./"):
+                        link_path = os.path.join(md_dir, target[2:])
+                    elif target.startswith("../"):
+                        link_path = os.path.join(md_dir, target)
+                    else:
+                        link_path = os.path.join(self.repo_path, target)
+
+                    if not self._path_exists(link_path):
+                        broken_files.append(md_file)
+                        broken_urls.append(link_url)
+                        broken_texts.append(match[1])
 
             except Exception as e:
                 check_result["issues"].append(f"Error checking links in {md_file}: {e!s}")
 
+        broken_count = len(broken_urls)
+
         # Calculate score
         if total_links > 0:
-            broken_percentage = len(broken_links) / total_links * 100
+            broken_percentage = broken_count / total_links * 100
             check_result["score"] = max(0, 100 - broken_percentage * 2)  # 2 points per broken link percentage
 
             if broken_percentage > self.thresholds["critical"]["broken_links_percent"]:
@@ -316,13 +503,20 @@ class HealthMonitor:
 
         check_result["details"] = {
             "total_links": total_links,
-            "broken_links": len(broken_links),
-            "broken_percentage": (len(broken_links) / total_links * 100 if total_links > 0 else 0),
-            "broken_link_details": broken_links[:10],  # First 10 broken links
+            "broken_links": broken_count,
+            "broken_percentage": (broken_count / total_links * 100 if total_links > 0 else 0),
+            "broken_link_details": [  # First 10 broken links
+                {
+                    "file": str(md_file.relative_to(self.repo_path)),
+                    "link": link_url,
+                    "text": text.decode("utf-8", "replace"),
+                }
+                for md_file, link_url, text in zip(broken_files[:10], broken_urls[:10], broken_texts[:10], strict=True)
+            ],
         }
 
-        if broken_links:
-            check_result["issues"].append(f"{len(broken_links)} broken internal links found")
+        if broken_count:
+            check_result["issues"].append(f"{broken_count} broken internal links found")
 
         return check_result
 
@@ -332,16 +526,14 @@ class HealthMonitor:
 
         try:
             # Load MANIFEST.yaml for reference
-            manifest_path = os.path.join(self.repo_path, "config", "MANIFEST.yaml")
-            if not os.path.exists(manifest_path):
+            try:
+                manifest = self._get_manifest()
+            except FileNotFoundError:
                 check_result["issues"].append("MANIFEST.yaml not found")
                 check_result["status"] = "critical"
                 check_result["score"] = 0
                 return check_result
 
-            with open(manifest_path) as f:
-                manifest = yaml.safe_load(f)
-
             standards = manifest.get("standards", {})
             consistency_issues = []
 
@@ -349,7 +541,7 @@ class HealthMonitor:
             missing_standards = []
             for _std_id, std_info in standards.items():
                 file_path = os.path.join(self.repo_path, "docs", "standards", std_info["full_name"])
-                if not os.path.exists(file_path):
+                if not self._path_exists(file_path):
                     missing_standards.append(std_info["full_name"])
 
             # Check for standards files not in manifest
@@ -366,21 +558,18 @@ class HealthMonitor:
             inconsistent_structures = []
             for _std_id, std_info in standards.items():
                 file_path = os.path.join(self.repo_path, "docs", "standards", std_info["full_name"])
-                if os.path.exists(file_path):
+                if self._path_exists(file_path):
                     try:
                         with open(file_path, encoding="utf-8") as f:
                             content = f.read()
 
-                        # Check for required sections
-                        required_sections = [
-                            "## Overview",
-                            "## Implementation",
-                            "## Examples",
-                        ]
-                        missing_sections = []
-                        for section in required_sections:
-                            if section not in content:
-                                missing_sections.append(section)
+                        # Check for required sections in one pass, stopping once all are seen
+                        found_sections = set()
+                        for match in _SECTIONS_RE.finditer(content):
+                            found_sections.add(match[0])
+                            if len(found_sections) == len(_REQUIRED_SECTIONS):
+                                break
+                        missing_sections = [s for s in _REQUIRED_SECTIONS if s not in found_sections]
 
                         if missing_sections:
                             inconsistent_structures.append(
@@ -425,54 +614,36 @@ class HealthMonitor:
         check_result = {"status": "healthy", "score": 100, "details": {}, "issues": []}
 
         try:
+            # Start both git queries before waiting on either so their latency overlaps;
+            # porcelain status output is locale-stable
+            git_kwargs = {"stdout": subprocess.PIPE, "stderr": subprocess.DEVNULL, "text": True, "cwd": self.repo_path}
+            status_proc = subprocess.Popen(["git", "status", "--porcelain=v1", "-z"], **git_kwargs)
+            commits_proc = subprocess.Popen(["git", "rev-list", "--count", "--since=30 days ago", "HEAD"], **git_kwargs)
+            status_out = status_proc.communicate()[0]
+            commits_out = commits_proc.communicate()[0]
+
             # Check if we're in a git repository
-            result = subprocess.run(["git", "status"], check=False, capture_output=True, text=True, cwd=self.repo_path)
-            if result.returncode != 0:
+            if status_proc.returncode != 0:
                 check_result["status"] = "critical"
                 check_result["score"] = 0
                 check_result["issues"].append("Not a valid Git repository")
                 return check_result
 
-            # Check for uncommitted changes
+            # Check for uncommitted changes: "XY path" records, untracked files excluded
             uncommitted_files = []
-            if result.stdout:
-                lines = result.stdout.split("\n")
-                in_changes_section = False
-                for line in lines:
-                    if "Changes not staged for commit:" in line or "Changes to be committed:" in line:
-                        in_changes_section = True
-                    elif in_changes_section and line.strip() and not line.startswith("\t"):
-                        in_changes_section = False
-                    elif in_changes_section and line.strip():
-                        file_match = re.search(r"\s+(?:modified|new file|deleted):\s+(.+)", line)
-                        if file_match:
-                            uncommitted_files.append(file_match.group(1))
+            records = iter(status_out.split("\0"))
+            for record in records:
+                if not record or record.startswith("??"):
+                    continue
+                uncommitted_files.append(record[3:])
+                if record[0] in "RC":
+                    next(records, None)  # Renames and copies carry the source path as an extra record
 
             # Check recent commit activity
-            recent_commits = subprocess.run(
-                ["git", "log", "--oneline", "--since=30 days ago"],
-                check=False,
-                capture_output=True,
-                text=True,
-                cwd=self.repo_path,
-            )
-            commit_count = len(recent_commits.stdout.strip().split("\n")) if recent_commits.stdout.strip() else 0
+            commit_count = int(commits_out) if commits_proc.returncode == 0 else 0
 
             # Check for large files
-            large_files = []
-            try:
-                find_result = subprocess.run(
-                    ["find", self.repo_path, "-type", "f", "-size", "+10M"],
-                    check=False,
-                    capture_output=True,
-                    text=True,
-                )
-                if find_result.stdout:
-                    large_files = [f.replace(self.repo_path + "/", "") for f in find_result.stdout.strip().split("\n")]
-                    # Filter out .git directory files
-                    large_files = [f for f in large_files if not f.startswith(".git/")]
-            except:
-                pass
+            large_files = self._get_scan()["large"]
 
             # Calculate score based on findings
             score_deductions = 0
@@ -514,13 +685,27 @@ class HealthMonitor:
 
         return check_result
 
+    def _sample_cpu_percent(self):
+        """Return CPU utilisation since the previous sample without sleeping"""
+        now = time.monotonic()
+        elapsed, self._cpu_sampled_at = now - self._cpu_sampled_at, now
+        cpu_percent = psutil.cpu_percent(interval=None)
+        if elapsed >= 0.1:
+            return cpu_percent
+
+        # Too short a window to be meaningful; use the aggregate since boot instead
+        times = psutil.cpu_times()
+        total = sum(times)
+        idle = times.idle + getattr(times, "iowait", 0)
+        return (total - idle) / total * 100 if total else 0.0
+
     def _check_system_resources(self):
         """Check system resource usage"""
         check_result = {"status": "healthy", "score": 100, "details": {}, "issues": []}
 
         try:
             # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = self._sample_cpu_percent()
 
             # Memory usage
             memory = psutil.virtual_memory()
@@ -576,56 +761,29 @@ class HealthMonitor:
 
         return check_result
 
-    def _check_security(self):
+    def _check_security(self, scan=None):
         """Check for security issues"""
         check_result = {"status": "healthy", "score": 100, "details": {}, "issues": []}
+        scan = scan or self._get_scan()
 
         security_issues = []
 
         # Check for sensitive files
-        sensitive_patterns = [
-            "*.key",
-            "*.pem",
-            "*password*",
-            "*secret*",
-            ".env*",
-            "id_rsa*",
-        ]
-
-        sensitive_files = []
-        for pattern in sensitive_patterns:
-            files = list(Path(self.repo_path).rglob(pattern))
-            # Filter out .git directory
-            files = [f for f in files if ".git" not in str(f)]
-            sensitive_files.extend(files)
+        sensitive_files = scan["sensitive"]
 
         if sensitive_files:
             security_issues.append(f"Potential sensitive files: {', '.join([f.name for f in sensitive_files[:5]])}")
 
         # Check for hardcoded secrets in code files
-        code_files = (
-            list(Path(self.repo_path).rglob("*.py"))
-            + list(Path(self.repo_path).rglob("*.js"))
-            + list(Path(self.repo_path).rglob("*.ts"))
-            + list(Path(self.repo_path).rglob("*.md"))
-        )
-
-        secret_patterns = [
-            r'password\s*=\s*["\'][^"\']+["\']',
-            r'api_key\s*=\s*["\'][^"\']+["\']',
-            r'secret\s*=\s*["\'][^"\']+["\']',
-            r'token\s*=\s*["\'][^"\']+["\']',
-        ]
+        code_files = chain(scan["py"], scan["js"], scan["ts"], scan["md"])
 
         files_with_secrets = []
-        for code_file in code_files[:20]:  # Check first 20 files
+        for code_file in islice(code_files, 20):  # Check first 20 files
             try:
                 with open(code_file, encoding="utf-8") as f:
                     content = f.read()
-                    for pattern in secret_patterns:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            files_with_secrets.append(code_file.name)
-                            break
+                    if _SECRET_RE.search(content):
+                        files_with_secrets.append(code_file.name)
             except:
                 continue
 
@@ -634,16 +792,7 @@ class HealthMonitor:
 
         # Check file permissions (Unix systems)
         if os.name != "nt":
-            executable_files = []
-            for root, dirs, files in os.walk(self.repo_path):
-                # Skip .git directory
-                if ".git" in dirs:
-                    dirs.remove(".git")
-
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if os.access(file_path, os.X_OK) and not file.endswith((".sh", ".py")):
-                        executable_files.append(file)
+            executable_files = [f.name for f in scan["executable"] if not f.name.endswith((".sh", ".py"))]
 
             if executable_files:
                 security_issues.append(f"Unexpected executable files: {', '.join(executable_files[:3])}")
@@ -672,38 +821,25 @@ class HealthMonitor:
         check_result = {"status": "healthy", "score": 100, "details": {}, "issues": []}
 
         try:
-            # Try to run compliance score calculation
+            # Load the compliance scorer in-process instead of spawning an interpreter
             compliance_script = os.path.join(self.repo_path, "scripts", "calculate_compliance_score.py")
             if os.path.exists(compliance_script):
-                result = subprocess.run(
-                    ["python3", compliance_script],
-                    check=False,
-                    capture_output=True,
-                    text=True,
-                    cwd=self.repo_path,
-                )
-
-                if result.returncode == 0:
-                    # Parse compliance score from output
-                    for line in result.stdout.split("\n"):
-                        if "Compliance Score:" in line:
-                            score_match = re.search(r"(\d+\.?\d*)%", line)
-                            if score_match:
-                                compliance_score = float(score_match.group(1))
-                                check_result["score"] = compliance_score
-
-                                if compliance_score < 70:
-                                    check_result["status"] = "critical"
-                                    check_result["issues"].append(f"Low compliance score: {compliance_score:.1f}%")
-                                elif compliance_score < 85:
-                                    check_result["status"] = "warning"
-                                    check_result["issues"].append(f"Moderate compliance score: {compliance_score:.1f}%")
-
-                                check_result["details"]["compliance_score"] = compliance_score
-                                break
-                else:
+                try:
+                    compliance_score = round(_load_compliance_module(compliance_script).calculate(self.repo_path), 1)
+                except Exception:
                     check_result["issues"].append("Compliance script failed to run")
                     check_result["score"] = 80
+                else:
+                    check_result["score"] = compliance_score
+
+                    if compliance_score < 70:
+                        check_result["status"] = "critical"
+                        check_result["issues"].append(f"Low compliance score: {compliance_score:.1f}%")
+                    elif compliance_score < 85:
+                        check_result["status"] = "warning"
+                        check_result["issues"].append(f"Moderate compliance score: {compliance_score:.1f}%")
+
+                    check_result["details"]["compliance_score"] = compliance_score
             else:
                 check_result["issues"].append("Compliance calculation script not found")
                 check_result["score"] = 90
@@ -718,7 +854,7 @@ class HealthMonitor:
 
             missing_docs = []
             for doc in required_docs:
-                if not os.path.exists(os.path.join(self.repo_path, doc)):
+                if not self._path_exists(os.path.join(self.repo_path, doc)):
                     missing_docs.append(doc)
 
             if missing_docs:
@@ -743,46 +879,34 @@ class HealthMonitor:
             health_report["health_score"] = 0
             return health_report
 
-        # Calculate weighted average score
-        weights = {
-            "file_integrity": 0.2,
-            "dependency_validation": 0.15,
-            "link_validation": 0.1,
-            "standards_consistency": 0.2,
-            "git_health": 0.15,
-            "system_resources": 0.1,
-            "security_validation": 0.05,
-            "compliance_checking": 0.05,
-        }
-
-        total_score = 0
-        total_weight = 0
-
+        # One pass over the checks gathers scores, weights, statuses and issues
+        scores = []
+        weights = []
+        has_critical = False
+        has_warning = False
+        all_issues = []
         for check_name, check_result in checks.items():
-            weight = weights.get(check_name, 0.1)
-            score = check_result.get("score", 0)
-            total_score += score * weight
-            total_weight += weight
+            scores.append(check_result.get("score", 0))
+            weights.append(_CHECK_WEIGHTS.get(check_name, 0.1))
+            status = check_result.get("status")
+            has_critical |= status == "critical"
+            has_warning |= status == "warning"
+            all_issues.extend(check_result.get("issues", []))
 
-        overall_score = total_score / total_weight if total_weight > 0 else 0
+        # Calculate weighted average score as a single dot product
+        total_weight = sum(weights)
+        overall_score = _sumprod(scores, weights) / total_weight if total_weight > 0 else 0
         health_report["health_score"] = round(overall_score, 2)
 
         # Determine overall status
-        critical_checks = [check for check in checks.values() if check.get("status") == "critical"]
-        warning_checks = [check for check in checks.values() if check.get("status") == "warning"]
-
-        if critical_checks or overall_score < 60:
+        if has_critical or overall_score < 60:
             health_report["overall_status"] = "critical"
-        elif warning_checks or overall_score < 80:
+        elif has_warning or overall_score < 80:
             health_report["overall_status"] = "warning"
         else:
             health_report["overall_status"] = "healthy"
 
         # Collect all alerts and recommendations
-        all_issues = []
-        for check_result in checks.values():
-            all_issues.extend(check_result.get("issues", []))
-
         health_report["alerts"] = all_issues
 
         # Generate recommendations
@@ -790,7 +914,7 @@ class HealthMonitor:
         if overall_score < 80:
             recommendations.append("Consider running individual health checks to identify specific issues")
 
-        if any(check.get("status") == "critical" for check in checks.values()):
+        if has_critical:
             recommendations.append("Critical issues detected - immediate attention required")
 
         if len(all_issues) > 10:
@@ -804,17 +928,21 @@ class HealthMonitor:
         """Save health report to file"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+        # Serialize once, compactly, and write the same payload to the detailed and
+        # latest reports; the text summary below is the human-readable copy
+        payload = json.dumps(health_report, separators=(",", ":"), default=str)
+
         # Save detailed JSON report
         json_filename = f"health_report_{timestamp}.json"
         json_path = os.path.join(self.health_dir, json_filename)
 
         with open(json_path, "w") as f:
-            json.dump(health_report, f, indent=2, default=str)
+            f.write(payload)
 
         # Save latest report
         latest_path = os.path.join(self.health_dir, "latest_health_report.json")
         with open(latest_path, "w") as f:
-            json.dump(health_report, f, indent=2, default=str)
+            f.write(payload)
 
         # Save summary text report
         summary_text = self._format_health_summary(health_report)
@@ -824,13 +952,14 @@ class HealthMonitor:
         with open(text_path, "w") as f:
             f.write(summary_text)
 
-        self.logger.info(f"Health report saved: {json_filename}")
+        self.logger.info("Health report saved: %s", json_filename)
 
     def _format_health_summary(self, health_report):
         """Format health report as readable text summary"""
         timestamp = datetime.fromisoformat(health_report["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
 
-        text = f"""
+        parts = [
+            f"""
 REPOSITORY HEALTH REPORT
 ========================
 Generated: {timestamp}
@@ -840,27 +969,28 @@ Health Score: {health_report["health_score"]}/100
 HEALTH CHECK RESULTS
 -------------------
 """
+        ]
 
         for check_name, check_result in health_report["checks"].items():
             status = check_result["status"].upper()
             score = check_result["score"]
-            text += f"{check_name.replace('_', ' ').title()}: {status} ({score}/100)\n"
+            parts.append(f"{check_name.replace('_', ' ').title()}: {status} ({score}/100)\n")
 
             if check_result.get("issues"):
                 for issue in check_result["issues"][:3]:  # First 3 issues
-                    text += f"  - {issue}\n"
+                    parts.append(f"  - {issue}\n")
 
         if health_report["alerts"]:
-            text += "\nALERTS\n------\n"
+            parts.append("\nALERTS\n------\n")
             for alert in health_report["alerts"][:10]:  # First 10 alerts
-                text += f"• {alert}\n"
+                parts.append(f"• {alert}\n")
 
         if health_report["recommendations"]:
-            text += "\nRECOMMENDATIONS\n---------------\n"
+            parts.append("\nRECOMMENDATIONS\n---------------\n")
             for rec in health_report["recommendations"]:
-                text += f"• {rec}\n"
+                parts.append(f"• {rec}\n")
 
-        return text
+        return "".join(parts)
 
 
 def main():
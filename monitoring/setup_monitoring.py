@@ -15,6 +15,115 @@ import logging
 import os
 import subprocess
 import sys
+from importlib.metadata import PackageNotFoundError, distribution
+from itertools import islice
+from pathlib import Path
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_config(data):
+    """Serialize a config mapping to indented UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # ensure_ascii=False writes non-ASCII as UTF-8, as orjson does, instead of \uXXXX escapes
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_executable(path, text):
+    """Write a script with mode 0o755, setting the mode through the open descriptor"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    with os.fdopen(fd, "w") as f:
+        # fchmod covers a pre-existing file and the umask, without another path lookup
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, 0o755)
+        else:
+            os.chmod(path, 0o755)
+        f.write(text)
+
+
+# Generated file templates, filled in with str.format_map({"repo_path": ...})
+_MONITORING_SCRIPT_TEMPLATE = """#!/bin/bash
+# Standards Repository Monitoring Wrapper Script
+
+set -e
+
+REPO_PATH="{repo_path}"
+MONITORING_DIR="$REPO_PATH/monitoring"
+
+cd "$REPO_PATH"
+
+echo "🔍 Running repository monitoring..."
+
+# Run analytics collection
+if [ -f "$MONITORING_DIR/analytics_collector.py" ]; then
+    echo "📊 Collecting analytics..."
+    python3 "$MONITORING_DIR/analytics_collector.py"
+fi
+
+# Run performance monitoring
+if [ -f "$MONITORING_DIR/performance_monitor.py" ]; then
+    echo "⚡ Running performance monitoring..."
+    python3 "$MONITORING_DIR/performance_monitor.py"
+fi
+
+# Run health check
+if [ -f "$MONITORING_DIR/health_monitor.py" ]; then
+    echo "🏥 Running health check..."
+    python3 "$MONITORING_DIR/health_monitor.py"
+fi
+
+# Generate automated reports
+if [ -f "$MONITORING_DIR/automated_reports.py" ]; then
+    echo "📝 Generating reports..."
+    python3 "$MONITORING_DIR/automated_reports.py" --scheduled
+fi
+
+echo "✅ Monitoring completed successfully!"
+"""
+
+_DASHBOARD_SCRIPT_TEMPLATE = """#!/bin/bash
+# Start Monitoring Dashboard
+
+set -e
+
+REPO_PATH="{repo_path}"
+MONITORING_DIR="$REPO_PATH/monitoring"
+
+cd "$REPO_PATH"
+
+echo "🚀 Starting monitoring dashboard..."
+
+if [ -f "$MONITORING_DIR/dashboard_server.py" ]; then
+    python3 "$MONITORING_DIR/dashboard_server.py" --port 8080 --host localhost
+else
+    echo "❌ Dashboard server not found!"
+    exit 1
+fi
+"""
+
+_CRON_JOBS_TEMPLATE = """# Standards Repository Monitoring Cron Jobs
+# Add these to your crontab with: crontab -e
+
+# Run monitoring every hour
+0 * * * * cd {repo_path} && ./monitoring/run_monitoring.sh >> ./monitoring/logs/cron.log 2>&1
+
+# Generate daily report at 6 AM
+0 6 * * * cd {repo_path} && python3 ./monitoring/automated_reports.py --daily >> ./monitoring/logs/daily_reports.log 2>&1
+
+# Generate weekly report on Sundays at 7 AM
+0 7 * * 0 cd {repo_path} && python3 ./monitoring/automated_reports.py --weekly >> ./monitoring/logs/weekly_reports.log 2>&1
+
+# Generate monthly report on the 1st of each month at 8 AM
+0 8 1 * * cd {repo_path} && python3 ./monitoring/automated_reports.py --monthly >> ./monitoring/logs/monthly_reports.log 2>&1
+
+# Health check every 6 hours
+0 */6 * * * cd {repo_path} && python3 ./monitoring/health_monitor.py >> ./monitoring/logs/health_check.log 2>&1
+"""
 
 
 class MonitoringSetup:
@@ -24,6 +133,25 @@ class MonitoringSetup:
         self.repo_path = repo_path or os.getcwd()
         self.monitoring_dir = os.path.join(self.repo_path, "monitoring")
 
+        # Absolute paths of every directory and generated file, joined once
+        self._paths = {
+            name: os.path.join(self.monitoring_dir, name)
+            for name in (
+                "metrics",
+                "reports",
+                "health",
+                "logs",
+                "config",
+                "config/monitoring_config.json",
+                "config/thresholds.json",
+                "config/cron_jobs.txt",
+                "run_monitoring.sh",
+                "start_dashboard.sh",
+                "requirements.txt",
+                "README.md",
+            )
+        }
+
         # Setup logging
         logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
         self.logger = logging.getLogger(__name__)
@@ -31,18 +159,25 @@ class MonitoringSetup:
     def setup_directories(self):
         """Create necessary directory structure"""
         directories = [
-            "monitoring",
-            "monitoring/metrics",
-            "monitoring/reports",
-            "monitoring/health",
-            "monitoring/logs",
-            "monitoring/config",
+            ("monitoring", self.monitoring_dir),
+            ("monitoring/metrics", self._paths["metrics"]),
+            ("monitoring/reports", self._paths["reports"]),
+            ("monitoring/health", self._paths["health"]),
+            ("monitoring/logs", self._paths["logs"]),
+            ("monitoring/config", self._paths["config"]),
         ]
 
         self.logger.info("Creating directory structure...")
-        for dir_path in directories:
-            full_path = os.path.join(self.repo_path, dir_path)
-            os.makedirs(full_path, exist_ok=True)
+        # Listed parent-first, so each directory needs a single mkdir;
+        # makedirs is only needed if the repository path itself is missing
+        for dir_path, full_path in directories:
+            try:
+                os.mkdir(full_path)
+            except FileExistsError:
+                if not os.path.isdir(full_path):
+                    raise
+            except FileNotFoundError:
+                os.makedirs(full_path, exist_ok=True)
             self.logger.info(f"✓ Created {dir_path}")
 
     def create_config_files(self):
@@ -110,9 +245,8 @@ class MonitoringSetup:
             },
         }
 
-        config_path = os.path.join(self.monitoring_dir, "config", "monitoring_config.json")
-        with open(config_path, "w") as f:
-            json.dump(monitoring_config, f, indent=2)
+        config_path = self._paths["config/monitoring_config.json"]
+        Path(config_path).write_bytes(encode_config(monitoring_config))
 
         self.logger.info(f"✓ Created monitoring configuration: {config_path}")
 
@@ -150,9 +284,8 @@ class MonitoringSetup:
             },
         }
 
-        thresholds_path = os.path.join(self.monitoring_dir, "config", "thresholds.json")
-        with open(thresholds_path, "w") as f:
-            json.dump(thresholds_config, f, indent=2)
+        thresholds_path = self._paths["config/thresholds.json"]
+        Path(thresholds_path).write_bytes(encode_config(thresholds_config))
 
         self.logger.info(f"✓ Created thresholds configuration: {thresholds_path}")
 
@@ -161,78 +294,17 @@ class MonitoringSetup:
         self.logger.info("Creating wrapper scripts...")
 
         # Create run_monitoring.sh
-        monitoring_script = f"""#!/bin/bash
-# Standards Repository Monitoring Wrapper Script
-
-set -e
-
-REPO_PATH="{self.repo_path}"
-MONITORING_DIR="$REPO_PATH/monitoring"
+        monitoring_script = _MONITORING_SCRIPT_TEMPLATE.format_map({"repo_path": self.repo_path})
 
-cd "$REPO_PATH"
-
-echo "🔍 Running repository monitoring..."
-
-# Run analytics collection
-if [ -f "$MONITORING_DIR/analytics_collector.py" ]; then
-    echo "📊 Collecting analytics..."
-    python3 "$MONITORING_DIR/analytics_collector.py"
-fi
-
-# Run performance monitoring
-if [ -f "$MONITORING_DIR/performance_monitor.py" ]; then
-    echo "⚡ Running performance monitoring..."
-    python3 "$MONITORING_DIR/performance_monitor.py"
-fi
-
-# Run health check
-if [ -f "$MONITORING_DIR/health_monitor.py" ]; then
-    echo "🏥 Running health check..."
-    python3 "$MONITORING_DIR/health_monitor.py"
-fi
-
-# Generate automated reports
-if [ -f "$MONITORING_DIR/automated_reports.py" ]; then
-    echo "📝 Generating reports..."
-    python3 "$MONITORING_DIR/automated_reports.py" --scheduled
-fi
-
-echo "✅ Monitoring completed successfully!"
-"""
-
-        script_path = os.path.join(self.monitoring_dir, "run_monitoring.sh")
-        with open(script_path, "w") as f:
-            f.write(monitoring_script)
-
-        os.chmod(script_path, 0o755)
+        script_path = self._paths["run_monitoring.sh"]
+        write_executable(script_path, monitoring_script)
         self.logger.info(f"✓ Created monitoring script: {script_path}")
 
         # Create start_dashboard.sh
-        dashboard_script = f"""#!/bin/bash
-# Start Monitoring Dashboard
-
-set -e
-
-REPO_PATH="{self.repo_path}"
-MONITORING_DIR="$REPO_PATH/monitoring"
-
-cd "$REPO_PATH"
-
-echo "🚀 Starting monitoring dashboard..."
-
-if [ -f "$MONITORING_DIR/dashboard_server.py" ]; then
-    python3 "$MONITORING_DIR/dashboard_server.py" --port 8080 --host localhost
-else
-    echo "❌ Dashboard server not found!"
-    exit 1
-fi
-"""
-
-        dashboard_script_path = os.path.join(self.monitoring_dir, "start_dashboard.sh")
-        with open(dashboard_script_path, "w") as f:
-            f.write(dashboard_script)
+        dashboard_script = _DASHBOARD_SCRIPT_TEMPLATE.format_map({"repo_path": self.repo_path})
 
-        os.chmod(dashboard_script_path, 0o755)
+        dashboard_script_path = self._paths["start_dashboard.sh"]
+        write_executable(dashboard_script_path, dashboard_script)
         self.logger.info(f"✓ Created dashboard script: {dashboard_script_path}")
 
     def check_dependencies(self):
@@ -242,11 +314,12 @@ fi
         required_packages = ["psutil", "pyyaml"]
         missing_packages = []
 
+        # Installed-distribution metadata lookup; avoids executing each package's import-time code
         for package in required_packages:
             try:
-                __import__(package)
+                distribution(package)
                 self.logger.info(f"✓ {package} is available")
-            except ImportError:
+            except PackageNotFoundError:
                 missing_packages.append(package)
                 self.logger.warning(f"✗ {package} is missing")
 
@@ -268,26 +341,9 @@ fi
         """Create cron job suggestions for automated monitoring"""
         self.logger.info("Creating cron job configuration...")
 
-        cron_config = f"""# Standards Repository Monitoring Cron Jobs
-# Add these to your crontab with: crontab -e
-
-# Run monitoring every hour
-0 * * * * cd {self.repo_path} && ./monitoring/run_monitoring.sh >> ./monitoring/logs/cron.log 2>&1
-
-# Generate daily report at 6 AM
-0 6 * * * cd {self.repo_path} && python3 ./monitoring/automated_reports.py --daily >> ./monitoring/logs/daily_reports.log 2>&1
-
-# Generate weekly report on Sundays at 7 AM
-0 7 * * 0 cd {self.repo_path} && python3 ./monitoring/automated_reports.py --weekly >> ./monitoring/logs/weekly_reports.log 2>&1
-
-# Generate monthly report on the 1st of each month at 8 AM
-0 8 1 * * cd {self.repo_path} && python3 ./monitoring/automated_reports.py --monthly >> ./monitoring/logs/monthly_reports.log 2>&1
+        cron_config = _CRON_JOBS_TEMPLATE.format_map({"repo_path": self.repo_path})
 
-# Health check every 6 hours
-0 */6 * * * cd {self.repo_path} && python3 ./monitoring/health_monitor.py >> ./monitoring/logs/health_check.log 2>&1
-"""
-
-        cron_path = os.path.join(self.monitoring_dir, "config", "cron_jobs.txt")
+        cron_path = self._paths["config/cron_jobs.txt"]
         with open(cron_path, "w") as f:
             f.write(cron_config)
 
@@ -299,9 +355,12 @@ fi
         requirements = """# Standards Repository Monitoring Requirements
 psutil>=5.8.0
 pyyaml>=6.0
+
+# Optional: faster JSON encoding for dashboard_server.py and setup_monitoring.py (falls back to json)
+# orjson>=3.9.0
 """
 
-        req_path = os.path.join(self.monitoring_dir, "requirements.txt")
+        req_path = self._paths["requirements.txt"]
         with open(req_path, "w") as f:
             f.write(requirements)
 
@@ -473,7 +532,7 @@ Enable debug logging by setting log level to "DEBUG" in configuration.
 For issues or questions, check the logs in `monitoring/logs/` for detailed error information.
 """
 
-        readme_path = os.path.join(self.monitoring_dir, "README.md")
+        readme_path = self._paths["README.md"]
         with open(readme_path, "w") as f:
             f.write(readme_content)
 
@@ -495,9 +554,10 @@ For issues or questions, check the logs in `monitoring/logs/` for detailed error
             self.logger.info(f"  Overall Status: {health_report['overall_status']}")
             self.logger.info(f"  Health Score: {health_report['health_score']}/100")
 
-            if health_report["alerts"]:
-                self.logger.warning(f"  Issues found: {len(health_report['alerts'])}")
-                for alert in health_report["alerts"][:3]:
+            alerts = health_report["alerts"]
+            if alerts:
+                self.logger.warning(f"  Issues found: {len(alerts)}")
+                for alert in islice(alerts, 3):
                     self.logger.warning(f"    - {alert}")
 
         except Exception as e:
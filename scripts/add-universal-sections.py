@@ -1,59 +1,84 @@
 #!/usr/bin/env python3
 """Add universal sections (Examples, Integration Points, Common Pitfalls) to all skills."""
 
+import os
 import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
 
+# Universal sections, in the order they are inserted
+UNIVERSAL_SECTIONS = ("Examples", "Integration Points", "Common Pitfalls")
+
+# Exact heading line (raw bytes) -> section name, probed per line in one pass over the file
+_SECTION_HEADINGS = {f"## {name}".encode(): name for name in UNIVERSAL_SECTIONS}
+_VALIDATION_RE = re.compile(r"^## Validation$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class SkillContext:
+    """Static context used to fill in a skill's Integration Points section."""
+
+    category: str
+    tools: tuple[str, ...] = ()
+    related: tuple[str, ...] = ()
+
+
 # Skill-specific content mappings
 SKILL_CONTEXTS = {
-    "authentication": {
-        "category": "security",
-        "tools": ["OAuth2", "JWT", "TOTP", "WebAuthn"],
-        "related": ["authorization", "api-security", "secrets-management"],
-    },
-    "authorization": {
-        "category": "security",
-        "tools": ["RBAC", "ABAC", "ACL", "Policy engines"],
-        "related": ["authentication", "api-security"],
-    },
-    "unit-testing": {
-        "category": "testing",
-        "tools": ["pytest", "Jest", "Go test", "unittest"],
-        "related": ["integration-testing", "e2e-testing", "ci-cd"],
-    },
-    "ci-cd": {
-        "category": "devops",
-        "tools": ["GitHub Actions", "GitLab CI", "Jenkins", "CircleCI"],
-        "related": ["infrastructure-as-code", "monitoring-observability"],
-    },
-    "kubernetes": {
-        "category": "cloud-native",
-        "tools": ["kubectl", "helm", "kustomize"],
-        "related": ["containers", "service-mesh", "monitoring-observability"],
-    },
-    "react": {
-        "category": "frontend",
-        "tools": ["React", "Redux", "React Router", "Jest"],
-        "related": ["typescript", "unit-testing", "e2e-testing"],
-    },
-    "sql": {
-        "category": "database",
-        "tools": ["PostgreSQL", "MySQL", "SQLite"],
-        "related": ["nosql", "advanced-optimization"],
-    },
-    "graphql": {
-        "category": "api",
-        "tools": ["Apollo Server", "GraphQL Yoga", "Hasura"],
-        "related": ["authentication", "authorization", "api-security"],
-    },
-    "secrets-management": {
-        "category": "security",
-        "tools": ["HashiCorp Vault", "AWS Secrets Manager", "Azure Key Vault"],
-        "related": ["authentication", "ci-cd", "kubernetes"],
-    },
+    "authentication": SkillContext(
+        category="security",
+        tools=("OAuth2", "JWT", "TOTP", "WebAuthn"),
+        related=("authorization", "api-security", "secrets-management"),
+    ),
+    "authorization": SkillContext(
+        category="security",
+        tools=("RBAC", "ABAC", "ACL", "Policy engines"),
+        related=("authentication", "api-security"),
+    ),
+    "unit-testing": SkillContext(
+        category="testing",
+        tools=("pytest", "Jest", "Go test", "unittest"),
+        related=("integration-testing", "e2e-testing", "ci-cd"),
+    ),
+    "ci-cd": SkillContext(
+        category="devops",
+        tools=("GitHub Actions", "GitLab CI", "Jenkins", "CircleCI"),
+        related=("infrastructure-as-code", "monitoring-observability"),
+    ),
+    "kubernetes": SkillContext(
+        category="cloud-native",
+        tools=("kubectl", "helm", "kustomize"),
+        related=("containers", "service-mesh", "monitoring-observability"),
+    ),
+    "react": SkillContext(
+        category="frontend",
+        tools=("React", "Redux", "React Router", "Jest"),
+        related=("typescript", "unit-testing", "e2e-testing"),
+    ),
+    "sql": SkillContext(
+        category="database",
+        tools=("PostgreSQL", "MySQL", "SQLite"),
+        related=("nosql", "advanced-optimization"),
+    ),
+    "graphql": SkillContext(
+        category="api",
+        tools=("Apollo Server", "GraphQL Yoga", "Hasura"),
+        related=("authentication", "authorization", "api-security"),
+    ),
+    "secrets-management": SkillContext(
+        category="security",
+        tools=("HashiCorp Vault", "AWS Secrets Manager", "Azure Key Vault"),
+        related=("authentication", "ci-cd", "kubernetes"),
+    ),
 }
 
+# Context for skills without an entry above
+_DEFAULT_CONTEXT = SkillContext(category="general")
+
 
 def generate_examples_section(skill_name: str, skill_path: str) -> str:
     """Generate skill-specific Examples section."""
@@ -66,6 +91,12 @@ def generate_examples_section(skill_name: str, skill_path: str) -> str:
     elif "rust" in skill_path:
         lang = "rust"
 
+    return _render_examples_section(skill_name, lang)
+
+
+@cache
+def _render_examples_section(skill_name: str, lang: str) -> str:
+    """Render the Examples section; memoized per (skill name, language)."""
     return f"""## Examples
 
 ### Basic Usage
@@ -93,12 +124,12 @@ See `examples/{skill_name}/` for complete working examples.
 """
 
 
-def generate_integration_points_section(skill_name: str, context: dict) -> str:
+@cache
+def generate_integration_points_section(skill_name: str, context: SkillContext) -> str:
     """Generate skill-specific Integration Points section."""
-    tools = ", ".join(context.get("tools", []))
-    related = context.get("related", [])
+    tools = ", ".join(context.tools)
 
-    related_links = "\n".join([f"- [{r.replace('-', ' ').title()}](../../{r}/SKILL.md)" for r in related])
+    related_links = "\n".join([f"- [{r.replace('-', ' ').title()}](../../{r}/SKILL.md)" for r in context.related])
 
     return f"""## Integration Points
 
@@ -106,7 +137,7 @@ This skill integrates with:
 
 ### Upstream Dependencies
 - **Tools**: {tools if tools else "Common development tools and frameworks"}
-- **Prerequisites**: Basic understanding of {context.get("category", "software development")} concepts
+- **Prerequisites**: Basic understanding of {context.category} concepts
 
 ### Downstream Consumers
 - **Applications**: Production systems requiring {skill_name} functionality
@@ -123,9 +154,9 @@ This skill integrates with:
 """
 
 
-def generate_common_pitfalls_section(skill_name: str) -> str:
-    """Generate Common Pitfalls section template."""
-    return f"""## Common Pitfalls
+# Common Pitfalls text is fixed apart from the skill name, so it is stored as
+# the literal text either side of that one insertion point
+_PITFALLS_HEAD = """## Common Pitfalls
 
 ### Pitfall 1: Insufficient Testing
 **Problem:** Not testing edge cases and error conditions leads to production bugs
@@ -159,7 +190,8 @@ def generate_common_pitfalls_section(skill_name: str) -> str:
 **Prevention:** Use security linters, SAST tools, and regular dependency updates
 
 **Best Practices:**
-- Follow established patterns and conventions for {skill_name}
+- Follow established patterns and conventions for """
+_PITFALLS_TAIL = """
 - Keep dependencies up to date and scan for vulnerabilities
 - Write comprehensive documentation and inline comments
 - Use linting and formatting tools consistently
@@ -169,16 +201,27 @@ def generate_common_pitfalls_section(skill_name: str) -> str:
 """
 
 
-def check_section_exists(content: str, section_name: str) -> bool:
-    """Check if a section already exists in the content."""
-    pattern = f"^## {section_name}$"
-    return bool(re.search(pattern, content, re.MULTILINE))
+@cache
+def generate_common_pitfalls_section(skill_name: str) -> str:
+    """Generate Common Pitfalls section template."""
+    return _PITFALLS_HEAD + skill_name + _PITFALLS_TAIL
+
+
+# (section name, generator) in insertion order; every generator takes (skill_name, skill_path, context)
+_SECTION_GENERATORS = (
+    ("Examples", lambda skill_name, skill_path, _context: generate_examples_section(skill_name, skill_path)),
+    (
+        "Integration Points",
+        lambda skill_name, _skill_path, context: generate_integration_points_section(skill_name, context),
+    ),
+    ("Common Pitfalls", lambda skill_name, _skill_path, _context: generate_common_pitfalls_section(skill_name)),
+)
 
 
 def find_insertion_point(content: str) -> int:
     """Find where to insert universal sections (before Validation or at end)."""
     # Look for ## Validation section
-    validation_match = re.search(r"^## Validation$", content, re.MULTILINE)
+    validation_match = _VALIDATION_RE.search(content)
     if validation_match:
         return validation_match.start()
 
@@ -191,44 +234,55 @@ def find_insertion_point(content: str) -> int:
     return len(content)
 
 
-def process_skill(skill_path: Path) -> tuple[bool, str]:
+def write_atomic(path: Path, text: str) -> None:
+    """Replace a file's content via a sibling temp file so readers never see a partial write."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(text.encode())
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def process_skill(skill_path: Path | str) -> tuple[bool, str]:
     """Process a single skill file to add universal sections."""
     try:
-        content = skill_path.read_text()
+        skill_path = Path(skill_path)
+        raw = skill_path.read_bytes()
         skill_name = skill_path.parent.name
 
-        # Check which sections are missing
-        missing_sections = []
-        if not check_section_exists(content, "Examples"):
-            missing_sections.append("Examples")
-        if not check_section_exists(content, "Integration Points"):
-            missing_sections.append("Integration Points")
-        if not check_section_exists(content, "Common Pitfalls"):
-            missing_sections.append("Common Pitfalls")
+        # Check which sections are missing, in one scan of the undecoded file
+        present = {_SECTION_HEADINGS[line] for line in _SECTION_HEADINGS.keys() & raw.split(b"\n")}
+        missing_sections = [name for name in UNIVERSAL_SECTIONS if name not in present]
 
         if not missing_sections:
             return False, f"Skipped (already has all sections): {skill_name}"
 
+        # Only files that will be rewritten are decoded
+        content = raw.decode()
+
         # Get skill context
-        context = SKILL_CONTEXTS.get(skill_name, {"category": "general", "tools": [], "related": []})
+        context = SKILL_CONTEXTS.get(skill_name, _DEFAULT_CONTEXT)
 
         # Generate missing sections
-        new_sections = []
-        if "Examples" in missing_sections:
-            new_sections.append(generate_examples_section(skill_name, str(skill_path)))
-        if "Integration Points" in missing_sections:
-            new_sections.append(generate_integration_points_section(skill_name, context))
-        if "Common Pitfalls" in missing_sections:
-            new_sections.append(generate_common_pitfalls_section(skill_name))
+        new_sections = [
+            generate(skill_name, str(skill_path), context)
+            for name, generate in _SECTION_GENERATORS
+            if name in missing_sections
+        ]
 
         # Find insertion point
         insertion_point = find_insertion_point(content)
 
         # Insert new sections
-        new_content = content[:insertion_point] + "\n".join(new_sections) + "\n---\n\n" + content[insertion_point:]
+        new_content = "".join(
+            (content[:insertion_point], "\n".join(new_sections), "\n---\n\n", content[insertion_point:])
+        )
 
         # Write back
-        skill_path.write_text(new_content)
+        write_atomic(skill_path, new_content)
 
         return True, f"✓ Updated {skill_name} (added {', '.join(missing_sections)})"
 
@@ -236,13 +290,28 @@ def process_skill(skill_path: Path) -> tuple[bool, str]:
         return False, f"✗ Error processing {skill_path}: {e}"
 
 
+def walk_skills(root) -> list[str]:
+    """Collect SKILL.md paths under root with os.scandir, reusing each entry's cached type."""
+    skill_paths = []
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name == "SKILL.md" and entry.is_file():
+                    skill_paths.append(entry.path)
+    return skill_paths
+
+
 def main():
     """Main processing function."""
     repo_root = Path(__file__).parent.parent
     skills_dir = repo_root / "skills"
 
     # Find all SKILL.md files
-    skill_files = list(skills_dir.rglob("SKILL.md"))
+    # Sorted as plain strings split into components, which orders like Path comparison
+    skill_files = sorted(walk_skills(skills_dir), key=lambda path: path.split(os.sep))
 
     print(f"Found {len(skill_files)} skill files")
     print("Processing skills...\n")
@@ -251,8 +320,12 @@ def main():
     skipped_count = 0
     error_count = 0
 
-    for skill_file in sorted(skill_files):
-        updated, message = process_skill(skill_file)
+    # Skills are independent files, so their reads and writes are overlapped
+    # across a thread pool; map() still yields results in sorted order
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(process_skill, skill_files))
+
+    for updated, message in results:
         print(message)
 
         if updated:
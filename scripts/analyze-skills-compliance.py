@@ -5,12 +5,38 @@ Generate comprehensive report with violations and recommendations.
 """
 
 import json
+import os
 import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Every top-level (# or ##) header line, with the required sections captured by
+# name; one finditer over a file replaces a scan per section. Matched against
+# the raw file bytes so files are never decoded as a whole
+_SECTION_HEADER_RE = re.compile(
+    rb"^(?:"
+    rb"(?P<level1>##[^\S\n]+Level 1:.*Quick Start)"
+    rb"|(?P<level2>##[^\S\n]+Level 2:.*Implementation)"
+    rb"|(?P<level3>##[^\S\n]+Level 3:.*Mastery)"
+    rb"|(?P<examples>##[^\S\n]+Examples?)"
+    rb"|(?P<integration>##[^\S\n]+Integration)"
+    rb"|(?P<pitfalls>##[^\S\n]+(?:Common Pitfalls|Pitfalls|Common Issues))"
+    rb"|#{1,2}[^\S\n]"
+    rb")",
+    re.MULTILINE,
+)
+
+
 @dataclass
 class SkillCompliance:
     """Compliance status for a single skill."""
@@ -55,40 +81,56 @@ class SkillCompliance:
         return len(self.violations) == 0 and len(self.token_violations) == 0
 
 
-def estimate_tokens(text: str) -> int:
+def encode_json(data) -> bytes:
+    """Serialize data (dataclasses included) to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # ensure_ascii=False writes non-ASCII as UTF-8, as orjson does, instead of \uXXXX escapes
+    return json.dumps(data, indent=2, default=asdict, ensure_ascii=False).encode("utf-8")
+
+
+def estimate_tokens(text: str | bytes) -> int:
     """Rough token estimation (words * 1.3)."""
     words = len(text.split())
     return int(words * 1.3)
 
 
-def extract_section_content(content: str, header_pattern: str) -> tuple[str, int, int]:
-    """Extract content between header and next same-level header."""
-    lines = content.split("\n")
-    in_section = False
-    section_lines = []
-    start_line = 0
+def index_sections(content: bytes) -> tuple[dict[str, int], list[int]]:
+    """Locate every top-level header in one pass; returns first offset per named section and all offsets."""
+    first_headers: dict[str, int] = {}
+    header_starts = []
+    for match in _SECTION_HEADER_RE.finditer(content):
+        header_starts.append(match.start())
+        if match.lastgroup is not None:
+            first_headers.setdefault(match.lastgroup, match.start())
+    return first_headers, header_starts
 
-    for i, line in enumerate(lines):
-        if re.match(header_pattern, line):
-            if in_section:
-                break
-            in_section = True
-            start_line = i
-            continue
 
-        if in_section:
-            # Stop at next same-level or higher header
-            if re.match(r"^#{1,2}\s+", line) and not re.match(r"^###", line):
-                break
-            section_lines.append(line)
+def extract_section(
+    content: bytes, first_headers: dict[str, int], header_starts: list[int], name: str
+) -> tuple[str, int]:
+    """Extract content between a section's first header and the next top-level header."""
+    header_start = first_headers.get(name)
+    if header_start is None:
+        return "", 0
 
-    content = "\n".join(section_lines).strip()
-    return content, start_line, estimate_tokens(content)
+    body_start = content.find(b"\n", header_start) + 1
+    if body_start == 0:
+        return "", 0
+
+    next_index = bisect_right(header_starts, header_start)
+    body_end = header_starts[next_index] if next_index < len(header_starts) else len(content)
+    # Only the section itself is decoded
+    section = content[body_start:body_end].decode("utf-8").strip()
+    return section, estimate_tokens(section)
 
 
 def analyze_skill(skill_path: Path) -> SkillCompliance:
     """Analyze a single SKILL.md file for compliance."""
-    content = skill_path.read_text(encoding="utf-8")
+    content = skill_path.read_bytes()
+    if b"\r" in content:
+        # Same newline normalization read_text() applies
+        content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
     rel_path = str(skill_path.relative_to(Path("/home/william/git/standards")))
     skill_name = skill_path.parent.name
 
@@ -96,14 +138,16 @@ def analyze_skill(skill_path: Path) -> SkillCompliance:
     missing_sections = []
     token_violations = []
 
+    first_headers, header_starts = index_sections(content)
+
     # Check frontmatter
-    has_frontmatter = content.startswith("---")
+    has_frontmatter = content.startswith(b"---")
     if not has_frontmatter:
         violations.append("Missing YAML frontmatter")
         missing_sections.append("YAML frontmatter with metadata")
 
     # Check Level 1: Quick Start
-    level1_content, _, level1_tokens = extract_section_content(content, r"^##\s+Level 1:.*Quick Start")
+    level1_content, level1_tokens = extract_section(content, first_headers, header_starts, "level1")
     has_level1 = bool(level1_content)
     if not has_level1:
         violations.append("Missing Level 1: Quick Start")
@@ -112,7 +156,7 @@ def analyze_skill(skill_path: Path) -> SkillCompliance:
         token_violations.append(f"Level 1 tokens: {level1_tokens} (expected: 100-150)")
 
     # Check Level 2: Implementation
-    level2_content, _, level2_tokens = extract_section_content(content, r"^##\s+Level 2:.*Implementation")
+    level2_content, level2_tokens = extract_section(content, first_headers, header_starts, "level2")
     has_level2 = bool(level2_content)
     if not has_level2:
         violations.append("Missing Level 2: Implementation")
@@ -121,7 +165,7 @@ def analyze_skill(skill_path: Path) -> SkillCompliance:
         token_violations.append(f"Level 2 tokens: {level2_tokens} (expected: 1,500-2,500)")
 
     # Check Level 3: Mastery
-    level3_content, _, level3_tokens = extract_section_content(content, r"^##\s+Level 3:.*Mastery")
+    level3_content, level3_tokens = extract_section(content, first_headers, header_starts, "level3")
     has_level3 = bool(level3_content)
     if not has_level3:
         violations.append("Missing Level 3: Mastery")
@@ -130,19 +174,19 @@ def analyze_skill(skill_path: Path) -> SkillCompliance:
         token_violations.append(f"Level 3 tokens: {level3_tokens} (expected: <100, mostly references)")
 
     # Check Examples
-    has_examples = bool(re.search(r"^##\s+Examples?", content, re.MULTILINE))
+    has_examples = "examples" in first_headers
     if not has_examples:
         violations.append("Missing Examples section")
         missing_sections.append("Examples section")
 
     # Check Integration
-    has_integration = bool(re.search(r"^##\s+(Integration|Integration Points|Integrations)", content, re.MULTILINE))
+    has_integration = "integration" in first_headers
     if not has_integration:
         violations.append("Missing Integration section")
         missing_sections.append("Integration points section")
 
     # Check Pitfalls
-    has_pitfalls = bool(re.search(r"^##\s+(Common Pitfalls|Pitfalls|Common Issues)", content, re.MULTILINE))
+    has_pitfalls = "pitfalls" in first_headers
     if not has_pitfalls:
         violations.append("Missing Common Pitfalls section")
         missing_sections.append("Common pitfalls section")
@@ -169,6 +213,39 @@ def analyze_skill(skill_path: Path) -> SkillCompliance:
     )
 
 
+# Bump when analyze_skill's output changes so older cache entries are ignored
+ANALYSIS_CACHE_VERSION = 1
+
+
+def load_analysis_cache(cache_path: Path) -> dict[str, dict]:
+    """Load cached analyses keyed by file path; a missing, unreadable or outdated cache is empty."""
+    try:
+        cache = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != ANALYSIS_CACHE_VERSION:
+        return {}
+    return cache.get("skills", {})
+
+
+def save_analysis_cache(cache_path: Path, entries: dict[str, dict]) -> None:
+    """Write the analysis cache through a temp file so an interrupted run cannot corrupt it."""
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    tmp_path.write_text(json.dumps({"version": ANALYSIS_CACHE_VERSION, "skills": entries}), encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+
+def analyze_skill_cached(skill_path: Path, cache: dict[str, dict]) -> tuple[SkillCompliance, dict]:
+    """Reuse a cached analysis while the file's mtime and size are unchanged; returns (result, cache entry)."""
+    stat = skill_path.stat()
+    entry = cache.get(str(skill_path))
+    if entry is not None and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+        return SkillCompliance(**entry["data"]), entry
+
+    result = analyze_skill(skill_path)
+    return result, {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "data": asdict(result)}
+
+
 def generate_report(compliance_data: list[SkillCompliance]) -> str:
     """Generate comprehensive compliance report in Markdown."""
     total_skills = len(compliance_data)
@@ -187,7 +264,8 @@ def generate_report(compliance_data: list[SkillCompliance]) -> str:
         for section in skill.missing_sections:
             section_counts[section] = section_counts.get(section, 0) + 1
 
-    report = f"""# Skills Compliance Analysis Report
+    parts: list[str] = []
+    parts.append(f"""# Skills Compliance Analysis Report
 
 **Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
@@ -210,122 +288,124 @@ def generate_report(compliance_data: list[SkillCompliance]) -> str:
 ## Overall Statistics
 
 ### Missing Sections (Most Common)
-"""
+""")
 
     for section, count in sorted(section_counts.items(), key=lambda x: x[1], reverse=True):
         pct = (count / total_skills) * 100
-        report += f"- **{section}**: {count} skills ({pct:.1f}%)\n"
+        parts.append(f"- **{section}**: {count} skills ({pct:.1f}%)\n")
 
-    report += """
+    parts.append("""
 ### Compliance Distribution
 
 | Score Range | Count | Percentage |
 |-------------|-------|------------|
-"""
+""")
 
     ranges = [("100%", 100, 100), ("80-99%", 80, 99), ("60-79%", 60, 79), ("40-59%", 40, 59), ("<40%", 0, 39)]
 
     for label, min_score, max_score in ranges:
         count = len([s for s in compliance_data if min_score <= s.compliance_score <= max_score])
         pct = (count / total_skills) * 100 if total_skills > 0 else 0
-        report += f"| {label} | {count} | {pct:.1f}% |\n"
+        parts.append(f"| {label} | {count} | {pct:.1f}% |\n")
 
     # Large skills section
-    report += f"""
+    parts.append(f"""
 ## Token Budget Violations
 
 **{len(large_skills)} skills** exceed 1,500 token budget:
 
 | Skill | Total Tokens | L1 Tokens | L2 Tokens | L3 Tokens |
 |-------|--------------|-----------|-----------|-----------|
-"""
+""")
 
     for skill in sorted(large_skills, key=lambda x: x.total_tokens, reverse=True)[:10]:
-        report += f"| {skill.name} | {skill.total_tokens} | {skill.level1_tokens} | {skill.level2_tokens} | {skill.level3_tokens} |\n"
+        parts.append(
+            f"| {skill.name} | {skill.total_tokens} | {skill.level1_tokens} | {skill.level2_tokens} | {skill.level3_tokens} |\n"
+        )
 
     # Detailed skill analysis
-    report += """
+    parts.append("""
 ## Detailed Skill Analysis
 
 ### Critical Priority (Compliance < 60%)
 
-"""
+""")
 
     critical = [s for s in compliance_data if s.compliance_score < 60]
     if critical:
         for skill in critical:
-            report += f"""#### {skill.name} ({skill.compliance_score:.0f}% compliant)
+            parts.append(f"""#### {skill.name} ({skill.compliance_score:.0f}% compliant)
 
 **Path:** `{skill.path}`
 
 **Missing Sections:**
-"""
+""")
             for section in skill.missing_sections:
-                report += f"- {section}\n"
+                parts.append(f"- {section}\n")
 
             if skill.token_violations:
-                report += "\n**Token Violations:**\n"
+                parts.append("\n**Token Violations:**\n")
                 for violation in skill.token_violations:
-                    report += f"- {violation}\n"
+                    parts.append(f"- {violation}\n")
 
-            report += "\n"
+            parts.append("\n")
     else:
-        report += "*No critical priority skills*\n\n"
+        parts.append("*No critical priority skills*\n\n")
 
-    report += """### High Priority (Compliance 60-79%)
+    parts.append("""### High Priority (Compliance 60-79%)
 
-"""
+""")
 
     high = [s for s in compliance_data if 60 <= s.compliance_score < 80]
     if high:
         for skill in high:
-            report += f"""#### {skill.name} ({skill.compliance_score:.0f}% compliant)
+            parts.append(f"""#### {skill.name} ({skill.compliance_score:.0f}% compliant)
 
 **Path:** `{skill.path}`
 
 **Missing Sections:**
-"""
+""")
             for section in skill.missing_sections:
-                report += f"- {section}\n"
+                parts.append(f"- {section}\n")
 
             if skill.token_violations:
-                report += "\n**Token Violations:**\n"
+                parts.append("\n**Token Violations:**\n")
                 for violation in skill.token_violations:
-                    report += f"- {violation}\n"
+                    parts.append(f"- {violation}\n")
 
-            report += "\n"
+            parts.append("\n")
     else:
-        report += "*No high priority skills*\n\n"
+        parts.append("*No high priority skills*\n\n")
 
-    report += """### Medium Priority (Compliance 80-99%)
+    parts.append("""### Medium Priority (Compliance 80-99%)
 
-"""
+""")
 
     medium = [s for s in compliance_data if 80 <= s.compliance_score < 100]
     if medium:
         for skill in medium:
-            report += (
+            parts.append(
                 f"- **{skill.name}** ({skill.compliance_score:.0f}%): Missing {', '.join(skill.missing_sections[:2])}"
             )
             if len(skill.missing_sections) > 2:
-                report += f" and {len(skill.missing_sections) - 2} more"
-            report += "\n"
+                parts.append(f" and {len(skill.missing_sections) - 2} more")
+            parts.append("\n")
     else:
-        report += "*No medium priority skills*\n"
+        parts.append("*No medium priority skills*\n")
 
-    report += """
+    parts.append("""
 ### Fully Compliant ✅
 
-"""
+""")
 
     if compliant_skills:
         for skill in sorted(compliant_skills, key=lambda x: x.name):
-            report += f"- {skill.name}\n"
+            parts.append(f"- {skill.name}\n")
     else:
-        report += "*No fully compliant skills yet*\n"
+        parts.append("*No fully compliant skills yet*\n")
 
     # Templates section
-    report += r"""
+    parts.append(r"""
 ## Template Sections for Common Missing Content
 
 ### YAML Frontmatter Template
@@ -526,9 +606,9 @@ code here
 ---
 
 *This report identifies issues only. Actual fixes will be implemented by remediation agents.*
-"""
+""")
 
-    return report
+    return "".join(parts)
 
 
 def main():
@@ -539,11 +619,20 @@ def main():
 
     print(f"Analyzing {len(skill_files)} SKILL.md files...")
 
+    # Unchanged files (same mtime and size as last run) reuse their cached analysis
+    cache_path = Path("/home/william/git/standards/reports/generated/.skill-cache.json")
+    cache = load_analysis_cache(cache_path)
+    cache_entries = {}
+
+    # Files are analyzed independently, so their reads overlap across a thread pool;
+    # map() yields results in input order, keeping the progress output unchanged
     compliance_data = []
-    for skill_file in skill_files:
-        print(f"  Analyzing {skill_file.relative_to(skills_dir.parent)}...")
-        result = analyze_skill(skill_file)
-        compliance_data.append(result)
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(partial(analyze_skill_cached, cache=cache), skill_files)
+        for skill_file, (result, entry) in zip(skill_files, results, strict=True):
+            print(f"  Analyzing {skill_file.relative_to(skills_dir.parent)}...")
+            compliance_data.append(result)
+            cache_entries[str(skill_file)] = entry
 
     # Generate report
     report = generate_report(compliance_data)
@@ -560,9 +649,11 @@ def main():
         "total_skills": len(compliance_data),
         "compliant_skills": len([s for s in compliance_data if s.is_compliant]),
         "average_compliance": sum(s.compliance_score for s in compliance_data) / len(compliance_data),
-        "skills": [asdict(s) for s in compliance_data],
+        "skills": compliance_data,
     }
-    json_path.write_text(json.dumps(json_data, indent=2), encoding="utf-8")
+    json_path.write_bytes(encode_json(json_data))
+
+    save_analysis_cache(cache_path, cache_entries)
 
     print("\n✅ Analysis complete!")
     print(f"   Report: {report_path}")
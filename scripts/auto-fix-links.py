@@ -49,6 +49,72 @@ LINK_FIXES = {
 }
 
 
+def pattern_literal(pattern: str) -> str | None:
+    """Return the exact text a pattern matches if it is a plain escaped literal, else None."""
+    chars = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            if char.isalnum():  # \d, \s, \b, ... are classes or anchors, not literals
+                return None
+            chars.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in ".^$*+?{}[]|()":
+            return None
+        else:
+            chars.append(char)
+    return None if escaped else "".join(chars)
+
+
+# LINK_FIXES compiled once at import, in the same order, as (literal, pattern, replacement).
+# Every current fix is a plain literal with a plain replacement, so it is found with a
+# substring test and applied with str.replace; other patterns fall back to the regex
+_LINK_FIX_RES = [
+    (None if "\\" in replacement else pattern_literal(pattern), re.compile(pattern), replacement)
+    for pattern, replacement in LINK_FIXES.items()
+]
+
+# Directory-specific relative path fixes; only the first matching directory applies
+DIR_LINK_FIXES = [
+    # For files in docs/nist, fix relative paths
+    (
+        "docs/nist",
+        [
+            (re.compile(r"\./docs/standards/"), "../standards/"),
+            (re.compile(r"\./docs/core/"), "../../"),  # CLAUDE.md is at root
+            (re.compile(r"\./docs/guides/"), "../guides/"),
+            (re.compile(r"\./examples/"), "../../examples/"),
+            (re.compile(r"\./standards/"), "../../standards/"),
+        ],
+    ),
+    # For files in docs/guides
+    (
+        "docs/guides",
+        [
+            (re.compile(r"\./docs/nist/"), "../nist/"),
+            (re.compile(r"\./docs/core/"), "../../"),  # CLAUDE.md is at root
+            (re.compile(r"\./docs/standards/"), "../standards/"),
+            (re.compile(r"\./CODING_STANDARDS\.md"), "../standards/CODING_STANDARDS.md"),
+            (re.compile(r"\./config/"), "../../config/"),
+            (re.compile(r"\./examples/"), "../../examples/"),
+        ],
+    ),
+    # For files in docs/standards
+    (
+        "docs/standards",
+        [
+            (re.compile(r"\./docs/nist/"), "../nist/"),
+            (re.compile(r"\./docs/guides/"), "../guides/"),
+            (re.compile(r"\./docs/core/"), "../../"),  # CLAUDE.md is at root
+            (re.compile(r"\./examples/"), "../../examples/"),
+            (re.compile(r"\./config/"), "../../config/"),
+        ],
+    ),
+]
+
+
 def fix_file_links(filepath: Path) -> int:
     """Fix links in a single file. Returns number of fixes made."""
     if not filepath.exists():
@@ -62,35 +128,21 @@ def fix_file_links(filepath: Path) -> int:
         # Special handling for files in specific directories
         file_dir = filepath.parent
 
-        # For files in docs/nist, fix relative paths
-        if "docs/nist" in str(file_dir):
-            content = re.sub(r"\./docs/standards/", "../standards/", content)
-            content = re.sub(r"\./docs/core/", "../../", content)  # CLAUDE.md is at root
-            content = re.sub(r"\./docs/guides/", "../guides/", content)
-            content = re.sub(r"\./examples/", "../../examples/", content)
-            content = re.sub(r"\./standards/", "../../standards/", content)
-
-        # For files in docs/guides
-        elif "docs/guides" in str(file_dir):
-            content = re.sub(r"\./docs/nist/", "../nist/", content)
-            content = re.sub(r"\./docs/core/", "../../", content)  # CLAUDE.md is at root
-            content = re.sub(r"\./docs/standards/", "../standards/", content)
-            content = re.sub(r"\./CODING_STANDARDS\.md", "../standards/CODING_STANDARDS.md", content)
-            content = re.sub(r"\./config/", "../../config/", content)
-            content = re.sub(r"\./examples/", "../../examples/", content)
-
-        # For files in docs/standards
-        elif "docs/standards" in str(file_dir):
-            content = re.sub(r"\./docs/nist/", "../nist/", content)
-            content = re.sub(r"\./docs/guides/", "../guides/", content)
-            content = re.sub(r"\./docs/core/", "../../", content)  # CLAUDE.md is at root
-            content = re.sub(r"\./examples/", "../../examples/", content)
-            content = re.sub(r"\./config/", "../../config/", content)
+        # Apply the fixes for the first matching directory
+        for dir_tag, dir_fixes in DIR_LINK_FIXES:
+            if dir_tag in str(file_dir):
+                for pattern, replacement in dir_fixes:
+                    content = pattern.sub(replacement, content)
+                break
 
         # Apply general fixes
-        for pattern, replacement in LINK_FIXES.items():
-            if re.search(pattern, content):
-                content = re.sub(pattern, replacement, content)
+        for literal, pattern, replacement in _LINK_FIX_RES:
+            if literal is not None:
+                if literal in content:
+                    content = content.replace(literal, replacement)
+                    fixes_made += 1
+            elif pattern.search(content):
+                content = pattern.sub(replacement, content)
                 fixes_made += 1
 
         # Save if changed
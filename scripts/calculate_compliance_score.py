@@ -10,23 +10,45 @@ import json
 import os
 
 
+def find_api_file(repo_path="."):
+    """Return the path of standards-api.json under repo_path, or None if absent"""
+    for candidate in ("standards-api.json", os.path.join("config", "standards-api.json")):
+        api_file = os.path.join(repo_path, candidate)
+        if os.path.exists(api_file):
+            return api_file
+    return None
+
+
+def score_rules(rules):
+    """Return (score, total_rules, required_rules) for a parsed standards-api document"""
+    total_rules = len(rules["rules"])
+    required_rules = len([r for r in rules["rules"] if r["severity"] == "required"])
+
+    score = (required_rules / total_rules) * 100 if total_rules > 0 else 0
+    return score, total_rules, required_rules
+
+
+def calculate(repo_path="."):
+    """Return the compliance score for repo_path; raises FileNotFoundError without standards-api.json"""
+    api_file = find_api_file(repo_path)
+    if api_file is None:
+        raise FileNotFoundError("Cannot find standards-api.json")
+
+    with open(api_file) as f:
+        return score_rules(json.load(f))[0]
+
+
 def main():
     # Check if we're in the right directory
-    if os.path.exists("standards-api.json"):
-        api_file = "standards-api.json"
-    elif os.path.exists("config/standards-api.json"):
-        api_file = "config/standards-api.json"
-    else:
+    api_file = find_api_file()
+    if api_file is None:
         print("Error: Cannot find standards-api.json")
         exit(1)
 
     with open(api_file) as f:
         rules = json.load(f)
 
-    total_rules = len(rules["rules"])
-    required_rules = len([r for r in rules["rules"] if r["severity"] == "required"])
-
-    score = (required_rules / total_rules) * 100 if total_rules > 0 else 0
+    score, total_rules, required_rules = score_rules(rules)
 
     print(f"Compliance Score: {score:.1f}%")
     print(f"Total Rules: {total_rules}")